@@ -0,0 +1,60 @@
+"""
+Backfill de temporadas pasadas (ver scraper/backfill.py).
+
+    python football/backfill.py --season 2023                       # todas las ligas
+    python football/backfill.py --league laliga2 --season 2019-2023
+    python football/backfill.py --league premier_league --season 2021 --force
+
+La URL de cada temporada sale de <BASE_WEEK_URL_X>_SEASON, con {season} (año de
+inicio) y opcionalmente {season_end}. Una ejecución interrumpida se reanuda
+donde se quedó: vuelve a lanzar el mismo comando.
+"""
+import argparse
+import sys
+
+from scraper import concurrency
+from scraper.backfill import backfill
+from scraper.concurrency import DEFAULT_BURST, DEFAULT_RPS, DEFAULT_WORKERS
+from scraper.leagues import LEAGUES
+
+
+def parse_seasons(values: list[str]) -> list[int]:
+    """'2021' o '2019-2023' (repetible) -> años de inicio ordenados y sin repetir."""
+    seasons = set()
+    for value in values:
+        lo, _, hi = value.partition("-")
+        seasons.update(range(int(lo), int(hi or lo) + 1))
+    return sorted(seasons)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Descarga temporadas pasadas completas, reanudando las que quedaron a medias.")
+    parser.add_argument("--season", action="append", required=True, help="Año de inicio (2023 = 2023-24) o rango 2019-2023 (repetible).")
+    parser.add_argument("--league", action="append", choices=sorted(LEAGUES), help="Liga (repetible). Por defecto, todas.")
+    parser.add_argument("--weeks", type=int, help="Jornadas por temporada (por defecto, las de la liga).")
+    parser.add_argument("--force", action="store_true", help="Volver a descargar aunque la temporada esté completa.")
+    parser.add_argument("--rps", type=float, default=DEFAULT_RPS, help=f"Peticiones por segundo por host (por defecto {DEFAULT_RPS}).")
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST, help=f"Ráfaga máxima de peticiones por host (por defecto {DEFAULT_BURST}).")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Descargas simultáneas (por defecto {DEFAULT_WORKERS}).")
+    parser.add_argument("--no-sleep", action="store_true", help="Sin límite de peticiones (útil para pruebas locales).")
+    args = parser.parse_args(argv)
+
+    sys.stdout.reconfigure(line_buffering=True, write_through=False)
+    concurrency.configure(rate=0 if args.no_sleep else args.rps, burst=args.burst)
+    seasons = parse_seasons(args.season)
+
+    pending = 0
+    for slug in args.league or list(LEAGUES):
+        cfg = LEAGUES[slug]
+        if not cfg.season_url:
+            print(f"⚠️ [{cfg.name}] Omitida: falta {cfg.url_env}_SEASON.")
+            continue
+        incomplete = backfill(cfg, seasons, weeks=args.weeks, max_workers=args.workers, force=args.force)
+        if incomplete:
+            print(f"⚠️ [{cfg.name}] Temporadas incompletas: {incomplete}")
+            pending += len(incomplete)
+    return 1 if pending else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Benchmarks offline del scraper (servidor local que imita la API, sin red)."""
@@ -0,0 +1,86 @@
+"""
+Payloads de jornada para el servidor de benchmark.
+
+Si hay respuestas grabadas (data/<liga>/json/matches_week_{n}.json) se usan tal
+cual. Si no, se reconstruyen a partir de matches_<liga>.json con la forma de
+cada API: {"matches": [...]} (LaLiga) o {"data": [...]} (Premier League).
+"""
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from scraper.leagues import DataApiAdapter, LeagueConfig
+
+TZ_MADRID = ZoneInfo("Europe/Madrid")
+TZ_LONDON = ZoneInfo("Europe/London")
+
+
+def _kickoff(row: dict) -> datetime | None:
+    # "Vie 15-08-2025" + "19:00" en hora de Madrid; "--:--" = horario sin confirmar
+    try:
+        day = row["Fecha"].split(" ", 1)[1]
+        if row.get("Horario", "--:--") == "--:--":
+            return datetime.strptime(day, "%d-%m-%Y").replace(tzinfo=timezone.utc)
+        return datetime.strptime(f"{day} {row['Horario']}", "%d-%m-%Y %H:%M").replace(tzinfo=TZ_MADRID)
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def _score(row: dict) -> tuple[int | None, int | None]:
+    try:
+        hs, as_ = row["Resultado"].split(" - ")
+        return int(hs), int(as_)
+    except (KeyError, ValueError):
+        return None, None
+
+
+def row_to_matches_api(row: dict, idx: int) -> dict:
+    kickoff = _kickoff(row)
+    hs, as_ = _score(row)
+    return {
+        "id": f"{row['Jornada']}-{idx}",
+        "date": kickoff.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ") if kickoff else "",
+        "status": "FullTime" if hs is not None else "PreMatch",
+        "home_score": hs,
+        "away_score": as_,
+        "home_team": {"nickname": row["Local"], "name": row["Local"]},
+        "away_team": {"nickname": row["Visitante"], "name": row["Visitante"]},
+    }
+
+
+def row_to_data_api(row: dict, idx: int) -> dict:
+    kickoff = _kickoff(row)
+    hs, as_ = _score(row)
+    return {
+        "matchId": f"{row['Jornada']}-{idx}",
+        "kickoff": kickoff.astimezone(TZ_LONDON).strftime("%Y-%m-%d %H:%M:%S") if kickoff else "",
+        "period": "FullTime" if hs is not None else "PreMatch",
+        "homeTeam": {"name": row["Local"], "score": hs},
+        "awayTeam": {"name": row["Visitante"], "score": as_},
+    }
+
+
+def synthesize_week(cfg: LeagueConfig, rows: list[dict]) -> dict:
+    if isinstance(cfg.adapter, DataApiAdapter):
+        return {"data": [row_to_data_api(r, i) for i, r in enumerate(rows)]}
+    return {"matches": [row_to_matches_api(r, i) for i, r in enumerate(rows)]}
+
+
+def load_payloads(cfg: LeagueConfig, source_dir: Path) -> dict[int, bytes]:
+    """semana -> cuerpo JSON de la respuesta, para una liga."""
+    payloads: dict[int, bytes] = {}
+    recorded = source_dir / cfg.slug / "json"
+    for path in sorted(recorded.glob("matches_week_*.json")) if recorded.exists() else []:
+        week = int(path.stem.rsplit("_", 1)[1])
+        payloads[week] = path.read_bytes()
+    if payloads:
+        return payloads
+
+    main = source_dir / cfg.slug / f"matches_{cfg.slug}.json"
+    with open(main, "r", encoding="utf-8") as f:
+        season = json.load(f)
+    for week, rows in season.items():
+        body = synthesize_week(cfg, rows)
+        payloads[int(week)] = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    return payloads
@@ -0,0 +1,291 @@
+"""
+Micro-benchmark de la normalización (extract_row y compañía) con baseline.
+
+Genera temporadas sintéticas completas (20 equipos, 380 partidos) en las dos
+formas de API, {"matches": [...]} y {"data": [...]}, y mide por partido:
+
+    ns_row      coste por fila en frío (mejor de --repeat por temporada, con las cachés de normalize vacías)
+    rel         ns_row / coste de un bucle de referencia medido a la vez
+    warm_ns_row coste por fila con las cachés ya llenas (lo habitual en una ejecución del pipeline)
+    warm_rel    warm_ns_row / coste del bucle de referencia
+    bytes_row   pico de memoria asignada por fila en una temporada (tracemalloc, en frío)
+
+Compara con bench/baselines/normalize.json y sale con código 1 si algún caso
+empeora más de --tolerance (rel o warm_rel) o --alloc-tolerance (bytes_row).
+Lo que se compara son los relativos, así que el baseline sirve en máquinas distintas.
+
+    python football/bench/normalize_bench.py
+    python football/bench/normalize_bench.py --seasons 20 --repeat 9
+    python football/bench/normalize_bench.py --update-baseline
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # football/ -> import scraper
+
+from bench.fixtures import row_to_data_api, row_to_matches_api  # noqa: E402
+from scraper import normalize  # noqa: E402
+from scraper.leagues import DataApiAdapter, MatchesApiAdapter  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / "baselines" / "normalize.json"
+BASELINE_VERSION = 2
+
+TEAMS = [
+    "Real Madrid Club de Fútbol", "FC Barcelona", "Club Atlético de Madrid SAD", "Athletic Club",
+    "Real Betis Balompié SAD", "Real Sociedad de Fútbol SAD", "Villarreal Club de Fútbol SAD",
+    "Valencia Club de Fútbol SAD", "Sevilla Fútbol Club SAD", "Getafe Club de Fútbol SAD",
+    "Girona Fútbol Club SAD", "Rayo Vallecano de Madrid SAD", "RC Celta de Vigo SAD", "CA Osasuna",
+    "RCD Mallorca SAD", "Deportivo Alavés SAD", "Levante UD SAD", "Elche Club de Fútbol SAD",
+    "RCD Espanyol de Barcelona SAD", "Real  Oviedo  SAD",
+]
+HOURS = ["14:00", "16:15", "18:30", "21:00", "--:--"]
+
+
+# =========================
+# FIXTURES SINTÉTICAS
+# =========================
+def season_rows(year: int, rng: random.Random) -> dict[int, list[dict]]:
+    """Doble vuelta de 20 equipos (método del círculo), con fechas y horarios variados."""
+    teams = TEAMS[:]
+    rng.shuffle(teams)
+    n = len(teams)
+    first = []
+    for r in range(n - 1):
+        first.append([(teams[i], teams[n - 1 - i]) if r % 2 else (teams[n - 1 - i], teams[i]) for i in range(n // 2)])
+        teams.insert(1, teams.pop())
+    rounds = first + [[(b, a) for a, b in pairs] for pairs in first]
+
+    start = datetime(year, 8, 15)
+    weeks = {}
+    for w, pairs in enumerate(rounds, start=1):
+        played = w <= len(rounds) * 2 // 3
+        rows = []
+        for home, away in pairs:
+            day = start + timedelta(days=7 * (w - 1) + rng.randint(0, 3))
+            rows.append({
+                "Jornada": w,
+                "Fecha": f"{normalize.WEEKDAY_ABBR_ES[day.weekday()]} {day:%d-%m-%Y}",
+                "Horario": rng.choice(HOURS[:-1]) if played else rng.choice(HOURS),
+                "Local": home,
+                "Resultado": f"{rng.randint(0, 4)} - {rng.randint(0, 4)}" if played else "VS",
+                "Visitante": away,
+            })
+        weeks[w] = rows
+    return weeks
+
+
+def build_fixtures(seasons: int, seed: int) -> dict[str, list[list[tuple[int, list]]]]:
+    """forma -> temporadas -> [(jornada, partidos)]."""
+    rng = random.Random(seed)
+    shapes = {"matches": [], "data": []}
+    for year in range(2000, 2000 + seasons):
+        weeks = season_rows(year, rng)
+        shapes["matches"].append([(w, [row_to_matches_api(r, i) for i, r in enumerate(rows)]) for w, rows in weeks.items()])
+        shapes["data"].append([(w, [row_to_data_api(r, i) for i, r in enumerate(rows)]) for w, rows in weeks.items()])
+    return shapes
+
+
+# =========================
+# CASOS
+# =========================
+def cases(shape: str, weeks: list[tuple[int, list]]) -> dict[str, callable]:
+    adapter = MatchesApiAdapter(subscription_key="bench") if shape == "matches" else DataApiAdapter()
+    matches = [(w, m) for w, ms in weeks for m in ms]
+    names = [adapter.team_names(m) for _, m in matches]
+    kickoffs = [adapter.kickoff_raw(m) for _, m in matches]
+
+    def extract_rows():
+        return [adapter.extract_rows(ms, w) for w, ms in weeks]
+
+    def extract_row():
+        return [adapter.extract_row(m, w) for w, m in matches]
+
+    def clean_team_name():
+        clean = adapter.clean_team_name
+        return [(clean(h), clean(a)) for h, a in names]
+
+    def format_fecha_y_hora():
+        fmt = adapter.format_fecha_y_hora
+        return [fmt(k) for k in kickoffs]
+
+    def resultado_partido():
+        res = adapter.resultado_partido
+        return [res(m) for _, m in matches]
+
+    fns = (extract_rows, extract_row, clean_team_name, format_fecha_y_hora, resultado_partido)
+    return {f"{shape}/{fn.__name__}": fn for fn in fns}
+
+
+def _reference(rows: list[tuple[int, list]]):
+    # Bucle de referencia: recorre los partidos y construye una fila con formato de cadenas
+    out = []
+    for w, ms in rows:
+        for i, m in enumerate(ms):
+            out.append({"Jornada": w, "Fecha": f"{i:02d}-{w:02d}", "Horario": str(i), "Local": "", "Resultado": "VS", "Visitante": ""})
+    return out
+
+
+def _timed(fn, cold: bool) -> int:
+    if cold:
+        normalize.clear_caches()
+    t0 = time.perf_counter_ns()
+    fn()
+    return time.perf_counter_ns() - t0
+
+
+def _best_of(fns: list, references: list, repeat: int, cold: bool) -> tuple[float, float]:
+    """
+    Suma, temporada a temporada, del mejor tiempo del caso y de la referencia.
+    Se alternan (y sin GC) para que el ruido de la máquina afecte a ambos, y el
+    mínimo por temporada descarta las interrupciones sueltas. En caliente las
+    cachés se vacían una sola vez y se llenan con una pasada previa sin medir.
+    """
+    best = [float("inf")] * len(fns)
+    best_ref = [float("inf")] * len(fns)
+    if not cold:
+        normalize.clear_caches()
+        for fn in fns:
+            fn()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for i, (fn, ref) in enumerate(zip(fns, references)):
+                best_ref[i] = min(best_ref[i], _timed(ref, cold=False))
+                best[i] = min(best[i], _timed(fn, cold))
+    finally:
+        gc.enable()
+    return sum(best), sum(best_ref)
+
+
+def _peak_bytes(fns: list) -> int:
+    """Pico de memoria de la temporada que más asigna."""
+    peak = 0
+    for fn in fns:
+        normalize.clear_caches()
+        tracemalloc.start()
+        try:
+            fn()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return peak
+
+
+def measure(seasons: int, repeat: int, seed: int) -> dict:
+    shapes = build_fixtures(seasons, seed)
+    n_rows = sum(len(ms) for season in shapes["matches"] for _, ms in season)
+    season_rows_n = n_rows // seasons
+    references = [lambda s=season: _reference(s) for season in shapes["matches"]]
+    results, calibs = {}, []
+    for shape, season_list in shapes.items():
+        per_season = [cases(shape, season) for season in season_list]
+        for name in per_season[0]:
+            fns = [c[name] for c in per_season]
+            best, best_ref = _best_of(fns, references, repeat, cold=True)
+            warm, warm_ref = _best_of(fns, references, repeat, cold=False)
+            calibs += [best_ref / n_rows, warm_ref / n_rows]
+            results[name] = {
+                "ns_row": round(best / n_rows, 1),
+                "rel": round(best / best_ref, 3),
+                "warm_ns_row": round(warm / n_rows, 1),
+                "warm_rel": round(warm / warm_ref, 3),
+                "bytes_row": round(_peak_bytes(fns) / season_rows_n, 1),
+            }
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "seasons": seasons,
+        "rows": n_rows,
+        "calibration_ns_row": round(min(calibs), 1),
+        "cases": results,
+    }
+
+
+# =========================
+# BASELINE
+# =========================
+def compare(current: dict, baseline: dict, tolerance: float, alloc_tolerance: float,
+            min_delta: float = 0.1) -> list[str]:
+    """
+    Casos que empeoran más de lo tolerado respecto al baseline. min_delta = subida
+    mínima de rel para contar (los casos de menos de 1 µs por fila son puro ruido).
+    """
+    regressions = []
+    for name, cur in current["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            continue
+        for key in ("rel", "warm_rel"):
+            if cur[key] > base[key] * (1 + tolerance) and cur[key] - base[key] >= min_delta:
+                regressions.append(f"{name}: {key} {base[key]} -> {cur[key]}")
+        if cur["bytes_row"] > base["bytes_row"] * (1 + alloc_tolerance):
+            regressions.append(f"{name}: bytes/fila {base['bytes_row']} -> {cur['bytes_row']}")
+    return regressions
+
+
+def _delta(cur: float, base: float | None) -> str:
+    return f"{(cur / base - 1) * 100:+.0f}%" if base else "-"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark de la normalización con control de regresiones.")
+    parser.add_argument("--seasons", type=int, default=10, help="Temporadas sintéticas de 380 partidos (por defecto 10).")
+    parser.add_argument("--repeat", type=int, default=7, help="Repeticiones por caso; cuenta la mejor (por defecto 7).")
+    parser.add_argument("--seed", type=int, default=1, help="Semilla de las fixtures.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Empeoramiento tolerado de rel (por defecto 0.25 = 25%%).")
+    parser.add_argument("--alloc-tolerance", type=float, default=0.10, help="Empeoramiento tolerado de bytes/fila (por defecto 0.10).")
+    parser.add_argument("--min-delta", type=float, default=0.1, help="Subida mínima de rel para contar como regresión (por defecto 0.1).")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="Fichero de baseline.")
+    parser.add_argument("--update-baseline", action="store_true", help="Guardar estos resultados como nuevo baseline.")
+    parser.add_argument("--json", type=Path, help="Guardar los resultados en este fichero JSON.")
+    args = parser.parse_args(argv)
+
+    current = measure(args.seasons, args.repeat, args.seed)
+    try:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        baseline = {}
+    if baseline.get("version") != BASELINE_VERSION:
+        baseline = {}
+
+    print(f"{current['rows']} filas por forma · referencia {current['calibration_ns_row']} ns/fila · Python {current['python']}")
+    print(f"{'caso':<32}{'ns/fila':>10}{'rel':>8}{'Δrel':>7}{'caliente':>10}{'rel':>8}{'Δrel':>7}"
+          f"{'bytes/fila':>12}{'Δbytes':>8}")
+    for name, r in current["cases"].items():
+        base = baseline.get("cases", {}).get(name, {})
+        print(f"{name:<32}{r['ns_row']:>10.1f}{r['rel']:>8.2f}{_delta(r['rel'], base.get('rel')):>7}"
+              f"{r['warm_ns_row']:>10.1f}{r['warm_rel']:>8.2f}{_delta(r['warm_rel'], base.get('warm_rel')):>7}"
+              f"{r['bytes_row']:>12.1f}{_delta(r['bytes_row'], base.get('bytes_row')):>8}")
+
+    if args.json:
+        args.json.write_text(json.dumps(current, indent=2), encoding="utf-8")
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"💾 Baseline guardado en {args.baseline}")
+        return 0
+    if not baseline:
+        print("⚠️ Sin baseline con el que comparar (usa --update-baseline).")
+        return 0
+
+    regressions = compare(current, baseline, args.tolerance, args.alloc_tolerance, args.min_delta)
+    if regressions:
+        print("❌ Regresiones respecto al baseline:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+    print("✅ Sin regresiones respecto al baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Benchmark end-to-end offline de process_league.
+
+Levanta bench/stub_api.py con las jornadas de cada liga (grabadas o
+reconstruidas desde matches_<liga>.json), ejecuta process_league contra él en un
+directorio temporal y mide, por liga y escenario:
+
+    wall_s          tiempo total
+    requests        peticiones recibidas por el servidor (y por status)
+    bytes_down      bytes de cuerpo enviados por el servidor
+    files_written   ficheros creados o modificados en data/<liga>/
+    bytes_written   tamaño total de esos ficheros
+
+Escenarios: cold (directorio vacío), warm (segunda ejecución seguida) y
+forced (--week con la ventana completa).
+
+    python football/bench/run_bench.py
+    python football/bench/run_bench.py --latency-ms 80 --jitter-ms 40 --error-rate 0.05 --json bench.json
+    python football/bench/run_bench.py --bulk      # API con descarga de temporada entera
+"""
+import argparse
+import dataclasses
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # football/ -> import scraper
+
+from bench.fixtures import load_payloads  # noqa: E402
+from bench.stub_api import StubApi  # noqa: E402
+from scraper import concurrency, metrics  # noqa: E402
+from scraper.leagues import DATA_DIR, LEAGUES, DataApiAdapter, MatchesApiAdapter  # noqa: E402
+from scraper.meta_store import MetaStore  # noqa: E402
+from scraper.pipeline import process_league  # noqa: E402
+
+SCENARIOS = ("cold", "warm", "forced")
+
+
+def _snapshot(root: Path) -> dict[Path, tuple[int, int]]:
+    return {
+        p: (p.stat().st_mtime_ns, p.stat().st_size)
+        for p in root.rglob("*") if p.is_file()
+    } if root.exists() else {}
+
+
+def _bench_config(slug: str, api: StubApi, data_dir: Path, season_weeks: int, bulk: bool = False):
+    cfg = LEAGUES[slug]
+    if isinstance(cfg.adapter, DataApiAdapter):
+        base = f"{api.base_url}/{slug}/weeks/{{week}}"
+        adapter = cfg.adapter
+    else:
+        base = f"{api.base_url}/{slug}"
+        adapter = MatchesApiAdapter(subscription_key="bench")
+    # Temporada = las jornadas grabadas (LaLiga2 declara 42 aunque el histórico tenga menos)
+    bulk_url = f"{api.base_url}/{slug}/season" if bulk else ""
+    return dataclasses.replace(cfg, base_week_url=base, adapter=adapter, data_dir=data_dir,
+                               season_weeks=season_weeks, bulk_url=bulk_url)
+
+
+def run_scenario(cfg, api: StubApi, scenario: str, forced_week: int, workers: int) -> dict:
+    league_dir = cfg.league_dir
+    before = _snapshot(league_dir)
+    MetaStore.clear_cache()          # cada ejecución real es un proceso nuevo
+    api.reset_stats()
+    metrics.reset(cfg.slug)
+
+    t0 = time.perf_counter()
+    process_league(
+        cfg,
+        forced_week=forced_week if scenario == "forced" else None,
+        max_workers=workers,
+    )
+    wall = time.perf_counter() - t0
+
+    after = _snapshot(league_dir)
+    written = [p for p, sig in after.items() if before.get(p) != sig]
+    return {
+        "league": cfg.slug,
+        "scenario": scenario,
+        "wall_s": round(wall, 4),
+        "requests": api.stats["requests"],
+        "status": dict(api.stats["status"]),
+        "bytes_down": api.stats["bytes_sent"],
+        "files_written": len(written),
+        "bytes_written": sum(after[p][1] for p in written),
+        "phases": {name: p["total_s"] for name, p in metrics.for_league(cfg.slug).to_dict()["phases"].items()},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark offline de process_league contra una API local.")
+    parser.add_argument("--league", action="append", choices=sorted(LEAGUES), help="Liga (repetible). Por defecto, todas.")
+    parser.add_argument("--source", type=Path, default=DATA_DIR, help=f"Datos de origen para las respuestas (por defecto {DATA_DIR}).")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Latencia fija por petición.")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Latencia aleatoria adicional (0..N ms).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fracción de respuestas con error (0..1).")
+    parser.add_argument("--error-status", type=int, default=503, help="Status de los errores inyectados.")
+    parser.add_argument("--conditional", choices=("auto", "all", "none"), default="auto",
+                        help="304 por liga: auto = solo la API de LaLiga (como en producción), all o none.")
+    parser.add_argument("--week", type=int, default=20, help="Jornada del escenario forced.")
+    parser.add_argument("--workers", type=int, default=concurrency.DEFAULT_WORKERS, help="Descargas simultáneas por liga.")
+    parser.add_argument("--rps", type=float, default=0, help="Límite de peticiones por segundo (0 = sin límite).")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="Escenario (repetible). Por defecto, todos en orden.")
+    parser.add_argument("--bulk", action="store_true", help="La API admite pedir la temporada entera (bulk_url).")
+    parser.add_argument("--json", type=Path, help="Guardar los resultados en este fichero JSON.")
+    args = parser.parse_args(argv)
+
+    concurrency.configure(rate=args.rps, burst=concurrency.DEFAULT_BURST)
+    api = StubApi(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status).start()
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="football-bench-") as tmp:
+            for slug in args.league or list(LEAGUES):
+                payloads = load_payloads(LEAGUES[slug], args.source)
+                cfg = _bench_config(slug, api, Path(tmp), max(payloads), bulk=args.bulk)
+                conditional = {"auto": not isinstance(cfg.adapter, DataApiAdapter), "all": True, "none": False}[args.conditional]
+                api.add_league(slug, payloads, conditional=conditional, bulk=args.bulk)
+                for scenario in args.scenario or SCENARIOS:
+                    results.append(run_scenario(cfg, api, scenario, args.week, args.workers))
+    finally:
+        api.stop()
+
+    print()
+    print(f"{'liga':<16}{'escenario':<10}{'wall_s':>9}{'reqs':>7}{'KB_down':>10}{'files':>7}{'KB_out':>9}  status")
+    for r in results:
+        print(f"{r['league']:<16}{r['scenario']:<10}{r['wall_s']:>9.3f}{r['requests']:>7}"
+              f"{r['bytes_down'] / 1024:>10.1f}{r['files_written']:>7}{r['bytes_written'] / 1024:>9.1f}  {r['status']}")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Servidor HTTP local que imita las APIs de jornadas.
+
+Rutas (una liga por prefijo):
+
+    /<liga>/week/<n>/matches     forma MatchesApiAdapter (LaLiga, LaLiga2)
+    /<liga>/weeks/<n>            forma DataApiAdapter (URL con plantilla {week})
+    /<liga>/season               temporada entera, cada partido con "week" (ligas con bulk=True)
+
+Opciones: latencia fija + jitter, GET condicional (ETag / Last-Modified) por
+liga activable, e inyección de errores (status configurable con Retry-After: 0).
+Cuenta peticiones, respuestas por status y bytes enviados.
+"""
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_ROUTE = re.compile(r"^/(?P<slug>[^/?]+)/weeks?/(?P<week>\d+)")
+_SEASON_ROUTE = re.compile(r"^/(?P<slug>[^/?]+)/season(?:[/?]|$)")
+
+
+def _with_week(payloads: dict[int, bytes]) -> tuple[dict[int, bytes], bytes]:
+    """Añade "week" a cada partido y compone la respuesta de temporada con todos."""
+    weeks, season, key = {}, [], "matches"
+    for week, body in sorted(payloads.items()):
+        obj = json.loads(body)
+        key = "data" if isinstance(obj, dict) and "data" in obj else "matches"
+        matches = [{**m, "week": week} for m in (obj.get(key) or [])]
+        season += matches
+        weeks[week] = json.dumps({**obj, key: matches}, ensure_ascii=False).encode("utf-8")
+    return weeks, json.dumps({key: season}, ensure_ascii=False).encode("utf-8")
+
+
+class StubApi:
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0.0,
+                 error_status: int = 503, seed: int = 0):
+        self.payloads: dict[str, dict[int, bytes]] = {}
+        self.seasons: dict[str, bytes] = {}
+        self.conditional: dict[str, bool] = {}
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._last_modified = formatdate(time.time() - 3600, usegmt=True)
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        self.reset_stats()
+
+    # ---------- datos ----------
+    def add_league(self, slug: str, payloads: dict[int, bytes], conditional: bool = True, bulk: bool = False):
+        if bulk:
+            payloads, self.seasons[slug] = _with_week(payloads)
+        self.payloads[slug] = payloads
+        self.conditional[slug] = conditional
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {"requests": 0, "bytes_sent": 0, "status": {}}
+
+    def _count(self, status: int, nbytes: int):
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["bytes_sent"] += nbytes
+            key = str(status)
+            self.stats["status"][key] = self.stats["status"].get(key, 0) + 1
+
+    def _roll_error(self) -> bool:
+        with self._lock:
+            return self.error_rate > 0 and self._rng.random() < self.error_rate
+
+    def _delay(self):
+        with self._lock:
+            ms = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if ms > 0:
+            time.sleep(ms / 1000.0)
+
+    # ---------- ciclo de vida ----------
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubApi":
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"   # keep-alive, como la API real
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes = b"", headers: dict | None = None):
+                self.send_response(status)
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+                api._count(status, len(body))
+
+            def do_GET(self):
+                api._delay()
+                m = _ROUTE.match(self.path)
+                if m:
+                    body = api.payloads.get(m["slug"], {}).get(int(m["week"]))
+                else:
+                    m = _SEASON_ROUTE.match(self.path)
+                    body = m and api.seasons.get(m["slug"])
+                if not body:
+                    return self._send(404)
+                if api._roll_error():
+                    return self._send(api.error_status, headers={"Retry-After": "0"})
+
+                etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                validators = {"ETag": etag, "Last-Modified": api._last_modified}
+                if api.conditional.get(m["slug"], True):
+                    if self.headers.get("If-None-Match") == etag or (
+                        "If-None-Match" not in self.headers
+                        and self.headers.get("If-Modified-Since") == api._last_modified
+                    ):
+                        return self._send(304, headers=validators)
+                else:
+                    validators = {}
+                self._send(200, body, {"Content-Type": "application/json", **validators})
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
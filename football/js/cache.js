@@ -58,3 +58,32 @@ function clearCache(baseDir) {
     });
   } catch {}
 })();
+
+/* =========================
+   Caché de shards por jornada (manifest.json)
+   Sin TTL: cada shard se valida con su hash del manifest.
+========================= */
+const SHARD_CACHE_PREFIX = "matches_shards_v1::";
+
+function loadShardCache(leagueDir) {
+  if (!canUseLocalStorage()) return null;
+  try {
+    const raw = localStorage.getItem(SHARD_CACHE_PREFIX + leagueDir);
+    if (!raw) return null;
+    const obj = JSON.parse(raw);
+    if (!obj || typeof obj.shards !== "object") return null;
+    return obj; // { revision, shards: { "1": { hash, rows }, ... } }
+  } catch {
+    return null;
+  }
+}
+
+function saveShardCache(leagueDir, revision, shards) {
+  if (!canUseLocalStorage()) return;
+  try {
+    localStorage.setItem(
+      SHARD_CACHE_PREFIX + leagueDir,
+      JSON.stringify({ revision, shards })
+    );
+  } catch {}
+}
@@ -135,7 +135,23 @@ function generateICS(rows) {
   return ics;
 }
 
+// .ics estático generado por el pipeline: /football/data/<liga>/ics/<liga|equipo>.ics
+function staticFeedUrl() {
+  if (!window.__LEAGUE_DIR__) return null;
+  var feed = window.__TEAM_SLUG__ || window.__LEAGUE_KEY__;
+  return feed ? window.__LEAGUE_DIR__ + "/ics/" + feed + ".ics" : null;
+}
+
 function exportToCalendar(rows) {
+  // Sin filtros se descarga el calendario ya generado en lugar de construirlo aquí
+  var feed = rows.length === __SOURCE_ROWS__.length ? staticFeedUrl() : null;
+  if (feed) {
+    var link = document.createElement("a");
+    link.href = feed;
+    link.download = feed.slice(feed.lastIndexOf("/") + 1);
+    link.click();
+    return;
+  }
   var ics = generateICS(rows);
   var blob = new Blob([ics], { type: "text/calendar;charset=utf-8" });
   var url = URL.createObjectURL(blob);
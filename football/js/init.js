@@ -50,8 +50,13 @@ function boot() {
 
   setLoading("Cargando calendario…", false);
 
-  // Carga el JSON principal
-  loadJSON(jsonFile)
+  // Carga por shards (solo jornadas cambiadas) con respaldo al JSON principal;
+  // con ?team=<slug> solo se descarga el fichero de ese equipo
+  const teamSlug = new URLSearchParams(location.search).get("team");
+  window.__LEAGUE_KEY__ = leagueKey;
+  window.__LEAGUE_DIR__ = jsonFile.slice(0, jsonFile.lastIndexOf("/"));
+  window.__TEAM_SLUG__ = teamSlug;
+  loadLeagueData(jsonFile, teamSlug)
     .then((data) => {
       window.__SOURCE_ROWS__ = Array.isArray(data) ? data : [];
       ensureWired();
@@ -1,22 +1,141 @@
 /* =========================
    Carga JSON
 ========================= */
+function rowsFromWeeks(obj) {
+  // obj es { "1": [...], "2": [...], ... }
+  const rows = [];
+  Object.entries(obj).forEach(([jornada, partidos]) => {
+    partidos.forEach((p) => {
+      // Añade el campo Jornada si no está
+      p.Jornada = p.Jornada || jornada;
+      rows.push(normalizeRow(p));
+    });
+  });
+  return rows.filter(
+    (r) =>
+      r.Jornada || r.Fecha || r.Horario || r.Local || r.Visitante || r.Resultado
+  );
+}
+
+/* =========================
+   Formato compacto (matches_<liga>.min.json)
+   Columnas + diccionarios de equipos, fechas y horarios; se decodifica en una pasada.
+========================= */
+function rowsFromCompact(obj) {
+  const { teams, dates, times, cols: c } = obj;
+  const rows = new Array(obj.n);
+  for (let i = 0; i < obj.n; i++) {
+    const gl = c.gl[i];
+    const ga = c.ga[i];
+    rows[i] = normalizeRow({
+      Jornada: c.j[i],
+      Fecha: dates[c.f[i]],
+      Horario: times[c.h[i]],
+      Local: teams[c.l[i]],
+      Resultado: gl == null || ga == null ? "VS" : `${gl} - ${ga}`,
+      Visitante: teams[c.a[i]],
+    });
+  }
+  return rows;
+}
+
+function rowsFromPayload(obj) {
+  return obj && obj.cols ? rowsFromCompact(obj) : rowsFromWeeks(obj);
+}
+
 function loadJSON(url) {
   return fetch(url)
-    .then((res) => res.json())
-    .then((obj) => {
-      // obj es { "1": [...], "2": [...], ... }
-      const rows = [];
-      Object.entries(obj).forEach(([jornada, partidos]) => {
-        partidos.forEach((p) => {
-          // Añade el campo Jornada si no está
-          p.Jornada = p.Jornada || jornada;
-          rows.push(normalizeRow(p));
-        });
+    .then((res) => {
+      if (!res.ok) throw new Error(url + " " + res.status);
+      return res.json();
+    })
+    .then(rowsFromPayload);
+}
+
+// Versión compacta; la variante .gz se descomprime en el navegador si puede.
+function loadCompactJSON(jsonFile) {
+  const url = jsonFile.replace(/\.json$/, ".min.json");
+  if (typeof DecompressionStream === "undefined") return loadJSON(url);
+  return fetch(url + ".gz")
+    .then((res) => {
+      if (!res.ok) throw new Error("gz " + res.status);
+      const stream = res.body.pipeThrough(new DecompressionStream("gzip"));
+      return new Response(stream).json();
+    })
+    .then(rowsFromPayload)
+    .catch(() => loadJSON(url));
+}
+
+/* =========================
+   Carga incremental por shards
+   /football/data/<liga>/manifest.json + weeks/week_N.json
+   Solo se descargan las jornadas cuyo hash no está ya en caché.
+========================= */
+function loadShardedJSON(leagueDir) {
+  return fetch(`${leagueDir}/manifest.json`, { cache: "no-cache" })
+    .then((res) => {
+      if (!res.ok) throw new Error("manifest " + res.status);
+      return res.json();
+    })
+    .then((manifest) => {
+      const cached = loadShardCache(leagueDir);
+      const known = (cached && cached.shards) || {};
+      const entries = Object.entries(manifest.shards || {});
+
+      return Promise.all(
+        entries.map(([week, info]) => {
+          const hit = known[week];
+          if (hit && hit.hash === info.hash) return [week, hit];
+          // El hash en la URL evita servir un shard viejo desde la caché HTTP
+          return fetch(`${leagueDir}/${info.file}?h=${info.hash}`)
+            .then((res) => {
+              if (!res.ok) throw new Error("shard " + week + " " + res.status);
+              return res.json();
+            })
+            .then((rows) => [week, { hash: info.hash, rows }]);
+        })
+      ).then((pairs) => {
+        const shards = Object.fromEntries(pairs);
+        saveShardCache(leagueDir, manifest.revision, shards);
+        const weeks = {};
+        pairs.forEach(([week, shard]) => (weeks[week] = shard.rows));
+        return rowsFromWeeks(weeks);
       });
-      return rows.filter(
-        (r) =>
-          r.Jornada || r.Fecha || r.Horario || r.Local || r.Visitante || r.Resultado
-      );
     });
-}
\ No newline at end of file
+}
+
+// Intenta la carga por shards; si falla, la versión compacta y, por último, el fichero completo.
+function loadLeagueData(jsonFile, teamSlug) {
+  const leagueDir = jsonFile.slice(0, jsonFile.lastIndexOf("/"));
+  const full = () =>
+    loadShardedJSON(leagueDir)
+      .catch(() => loadCompactJSON(jsonFile))
+      .catch(() => loadJSON(jsonFile));
+  // Vista de un equipo: solo su fichero (unos KB) en lugar de toda la liga
+  return teamSlug ? loadTeamJSON(leagueDir, teamSlug).catch(full) : full();
+}
+
+/* =========================
+   Índice por equipo
+   /football/data/<liga>/teams/index.json + teams/<equipo>.json
+========================= */
+function loadTeamDirectory(leagueDir) {
+  return fetch(`${leagueDir}/teams/index.json`, { cache: "no-cache" }).then((res) => {
+    if (!res.ok) throw new Error("teams " + res.status);
+    return res.json();
+  });
+}
+
+function loadTeamJSON(leagueDir, teamSlug) {
+  return loadTeamDirectory(leagueDir)
+    .then((dir) => {
+      const info = (dir.teams || {})[teamSlug];
+      if (!info) throw new Error("equipo desconocido: " + teamSlug);
+      return fetch(`${leagueDir}/${info.file}?h=${info.hash}`);
+    })
+    .then((res) => {
+      if (!res.ok) throw new Error("team " + res.status);
+      return res.json();
+    })
+    .then((team) => (team.matches || []).map(normalizeRow));
+}
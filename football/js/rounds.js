@@ -21,8 +21,10 @@ function generateRounds() {
     resetBtn.textContent = "Jornada";        // texto del botón limpiar
   }
 
-  // Repobla de forma determinista
-  for (let i = 1; i <= 38; i++) {
+  // Repobla de forma determinista (LaLiga2 tiene 42 jornadas, el resto 38)
+  const rows = window.__SOURCE_ROWS__ || [];
+  const maxRound = rows.reduce((max, r) => Math.max(max, Number(r.Jornada) || 0), 0) || 38;
+  for (let i = 1; i <= maxRound; i++) {
     const li = document.createElement("li");
     const btn = document.createElement("button");
     btn.className = "dropdown-item";
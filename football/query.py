@@ -0,0 +1,87 @@
+"""
+Consultas y exportación desde el almacén SQLite (ver scraper/store.py).
+
+    FOOTBALL_STORE=football/data/matches.sqlite python football/query.py --import
+    python football/query.py --h2h "Real Madrid" "FC Barcelona"
+    python football/query.py --team "Real Betis" --home --played
+    python football/query.py --export laliga --season 2025 > matches_laliga.json
+
+--import carga en el almacén los matches_<liga>.json actuales y las temporadas
+de seasons/ ya completas. La ruta del almacén sale de --store o FOOTBALL_STORE.
+"""
+import argparse
+import json
+import sys
+
+from scraper import canonical
+from scraper.backfill import load_checkpoint, season_json_path
+from scraper.leagues import LEAGUES
+from scraper.store import STORE_PATH, MatchStore, infer_season
+
+
+def import_files(store: MatchStore):
+    for cfg in LEAGUES.values():
+        if cfg.main_json_path.exists():
+            all_weeks = json.loads(cfg.main_json_path.read_text(encoding="utf-8"))
+            season = infer_season(all_weeks)
+            if season is not None:
+                rows = store.upsert_weeks(cfg.slug, season, all_weeks)
+                print(f"🗄️ [{cfg.name}] Temporada {season}: {rows} filas cambiadas.", file=sys.stderr)
+        if not cfg.seasons_dir.exists():
+            continue
+        for d in sorted(p for p in cfg.seasons_dir.iterdir() if p.name.isdigit()):
+            season = int(d.name)
+            path = season_json_path(cfg, season)
+            if not load_checkpoint(cfg, season, cfg.season_weeks)["complete"] or not path.exists():
+                continue
+            rows = store.upsert_weeks(cfg.slug, season, json.loads(path.read_text(encoding="utf-8")))
+            print(f"🗄️ [{cfg.name}] Temporada {season}: {rows} filas cambiadas.", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Consultas y exportación desde el almacén SQLite de partidos.")
+    parser.add_argument("--store", default=STORE_PATH, help="Ruta del almacén (por defecto FOOTBALL_STORE).")
+    parser.add_argument("--import", dest="do_import", action="store_true", help="Cargar los JSON de football/data en el almacén.")
+    parser.add_argument("--league", choices=sorted(LEAGUES), help="Filtrar por liga.")
+    parser.add_argument("--season", type=int, help="Año de inicio de la temporada (2025 = 2025-26).")
+    parser.add_argument("--week", type=int, help="Jornada.")
+    parser.add_argument("--team", help="Partidos de un equipo.")
+    venue = parser.add_mutually_exclusive_group()
+    venue.add_argument("--home", action="store_true", help="Con --team: solo en casa.")
+    venue.add_argument("--away", action="store_true", help="Con --team: solo fuera.")
+    parser.add_argument("--played", action="store_true", help="Solo partidos con resultado.")
+    parser.add_argument("--h2h", nargs=2, metavar=("EQUIPO_A", "EQUIPO_B"), help="Enfrentamientos directos.")
+    parser.add_argument("--export", metavar="LIGA", choices=sorted(LEAGUES),
+                        help="Escribe en stdout matches_<liga>.json de --season (por defecto, la última).")
+    args = parser.parse_args(argv)
+
+    if not args.store:
+        parser.error("falta --store o FOOTBALL_STORE")
+
+    with MatchStore(args.store) as store:
+        if args.do_import:
+            import_files(store)
+        if args.export:
+            seasons = store.seasons(args.export)
+            season = args.season or (seasons[-1] if seasons else None)
+            if season is None:
+                print(f"⚠️ Sin datos de {args.export} en el almacén.", file=sys.stderr)
+                return 1
+            sys.stdout.write(canonical.dumps(store.export_league(args.export, season), indent=2, sort_keys=False))
+            return 0
+        if args.h2h:
+            rows = store.head_to_head(*args.h2h, league=args.league)
+        elif args.team or args.league or args.season or args.week or args.played:
+            home = True if args.home else False if args.away else None
+            rows = store.matches(league=args.league, season=args.season, jornada=args.week,
+                                 team=args.team, home=home, played=args.played or None)
+        else:
+            return 0
+    for r in rows:
+        print(f"J{r['Jornada']:<3} {r['Fecha']} {r['Horario']}  {r['Local']} {r['Resultado']} {r['Visitante']}")
+    print(f"📋 {len(rows)} partidos.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
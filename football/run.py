@@ -0,0 +1,227 @@
+"""
+Punto de entrada único del scraper: procesa todas las ligas registradas en
+scraper/leagues.py, cada una en su propio proceso, con un presupuesto de
+peticiones por host compartido entre todos ellos.
+
+    python football/run.py                                 # todas las ligas con URL
+    python football/run.py --league laliga --week 12
+    python football/run.py --week laliga=12 --week premier_league=10
+    python football/run.py --report run_report.json --profile prof/
+    python football/run.py --watch --interval 60 --watch-for 240   # resultados casi en directo
+
+Al terminar imprime una línea `RUN_REPORT {...}` con el informe JSON de la
+ejecución (tiempos por fase, respuestas HTTP, bytes y semanas por liga).
+"""
+import argparse
+import cProfile
+import json
+import multiprocessing
+import queue
+import signal
+import sys
+import time
+import traceback
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+
+from scraper import concurrency, metrics
+from scraper.concurrency import DEFAULT_BURST, DEFAULT_RPS, DEFAULT_WORKERS
+from scraper.leagues import LEAGUES
+from scraper.meta_store import utc_now_iso
+from scraper.pipeline import process_league
+from scraper.watch import DEFAULT_INTERVAL, LeagueWatcher
+
+
+@dataclass
+class RunOptions:
+    weeks: dict[str, int | None] = field(default_factory=dict)   # liga -> semana forzada
+    max_workers: int = DEFAULT_WORKERS
+    force: bool = False
+    resume: bool = False                  # solo lo pendiente de la ejecución anterior (meta/run.json)
+    rate: float = DEFAULT_RPS
+    burst: int = DEFAULT_BURST
+    profile_dir: Path | None = None
+    watch: bool = False
+    interval: float = DEFAULT_INTERVAL
+    watch_for: float = 0                  # minutos; 0 = sin límite
+
+
+def run_league(slug: str, opts: RunOptions) -> dict:
+    """Procesa una liga y devuelve su parte del informe (nunca lanza)."""
+    cfg = LEAGUES[slug]
+    profiler = cProfile.Profile() if opts.profile_dir else None
+    status = "ok"
+    t0 = time.perf_counter()
+    try:
+        if profiler:
+            profiler.enable()
+        if opts.watch:
+            watch_league(cfg, opts)
+        else:
+            process_league(cfg, forced_week=opts.weeks.get(slug), max_workers=opts.max_workers,
+                           force=opts.force, resume=opts.resume)
+    except Exception as e:
+        status = f"error: {type(e).__name__}"
+        print(f"❌ [{cfg.name}] Fallo inesperado: {type(e).__name__}")
+        traceback.print_exc()
+    finally:
+        if profiler:
+            profiler.disable()
+            opts.profile_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(opts.profile_dir / f"{slug}.prof")
+
+    report = metrics.for_league(slug).to_dict()
+    report["wall_s"] = round(time.perf_counter() - t0, 4)
+    report["status"] = status
+    return report
+
+
+def watch_league(cfg, opts: RunOptions):
+    watcher = LeagueWatcher(cfg, interval=opts.interval, max_workers=opts.max_workers)
+    # SIGTERM (p. ej. al cancelar el job) termina el bucle y vuelca lo pendiente
+    signal.signal(signal.SIGTERM, lambda *_: watcher.stop())
+    watcher.start(forced_week=opts.weeks.get(cfg.slug), force=opts.force)
+    try:
+        watcher.run(timedelta(minutes=opts.watch_for) if opts.watch_for else None)
+    except KeyboardInterrupt:
+        print(f"🛑 [{cfg.name}] Watch detenido.")
+
+
+def _league_worker(slug: str, opts: RunOptions, buckets: dict, results):
+    concurrency.configure(rate=opts.rate, burst=opts.burst)
+    concurrency.install_buckets(buckets)
+    results.put(run_league(slug, opts))
+
+
+def parse_week_args(values: list[str], slugs: list[str]) -> dict[str, int | None]:
+    """--week N (todas las ligas) o --week <liga>=N (una liga)."""
+    weeks: dict[str, int | None] = {slug: None for slug in slugs}
+    for value in values or []:
+        if "=" in value:
+            slug, _, n = value.partition("=")
+            if slug not in LEAGUES:
+                raise SystemExit(f"Liga desconocida en --week: {slug}")
+            weeks[slug] = int(n)
+        else:
+            for slug in slugs:
+                weeks[slug] = int(value)
+    return weeks
+
+
+def run(slugs: list[str], opts: RunOptions) -> list[dict]:
+    """Lanza un proceso por liga (ninguno si solo hay una). Devuelve el informe de cada liga."""
+    active = []
+    for slug in slugs:
+        cfg = LEAGUES[slug]
+        if cfg.base_week_url:
+            print(f"🏁 [{cfg.name}] En cola.")
+            active.append(slug)
+        else:
+            print(f"⚠️ [{cfg.name}] Omitida: falta {cfg.url_env}.")
+    if not active:
+        return []
+
+    concurrency.configure(rate=opts.rate, burst=opts.burst)
+    if len(active) == 1:
+        return [run_league(active[0], opts)]
+
+    ctx = multiprocessing.get_context()
+    buckets = concurrency.shared_buckets([LEAGUES[s].base_week_url for s in active], opts.rate, opts.burst, ctx)
+    results = ctx.Queue()
+    procs = []
+    for slug in active:
+        p = ctx.Process(target=_league_worker, args=(slug, opts, buckets, results), name=f"league-{slug}")
+        p.start()
+        procs.append((slug, p))
+
+    # Se vacía la cola antes de join: un hijo no termina mientras su put esté pendiente.
+    reports = {}
+    pending = set(active)
+    while pending:
+        try:
+            report = results.get(timeout=1)
+        except queue.Empty:
+            if not any(p.is_alive() for slug, p in procs if slug in pending):
+                break   # murieron sin informe
+            continue
+        reports[report["league"]] = report
+        pending.discard(report["league"])
+    for slug, p in procs:
+        p.join()
+        if slug not in reports:
+            print(f"❌ [{LEAGUES[slug].name}] El proceso terminó con código {p.exitcode}.")
+            reports[slug] = {"league": slug, "status": f"exitcode {p.exitcode}"}
+    return [reports[slug] for slug in active]
+
+
+def print_report(report: dict, path: Path | None):
+    for r in report["leagues"]:
+        name = LEAGUES[r["league"]].name
+        if "weeks" not in r:
+            print(f"📊 [{name}] {r['status']}")
+            continue
+        w = r["weeks"]
+        print(
+            f"📊 [{name}] {r['wall_s']:.2f} s · HTTP {r['http'] or '-'} · semanas "
+            f"{w['changed']} cambiadas / {w['unchanged']} sin cambios / {w['failed']} fallidas de {w['planned']} · "
+            f"{r['bytes_in'] / 1024:.1f} KB in / {r['bytes_out'] / 1024:.1f} KB out"
+        )
+    print("RUN_REPORT " + json.dumps(report, ensure_ascii=False, separators=(",", ":")))
+    if path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Descarga las jornadas que lo necesitan (según su estado) de todas las ligas configuradas, una por proceso, y genera JSON."
+    )
+    parser.add_argument("--league", action="append", choices=sorted(LEAGUES), help="Liga a procesar (repetible). Por defecto, todas.")
+    parser.add_argument("--week", action="append", help="Forzar semana actual: N para todas o <liga>=N (repetible).")
+    parser.add_argument("--force", action="store_true", help="Ignorar el plan de refresco y pedir la ventana (prev, actual, +4) aunque esté finalizada.")
+    parser.add_argument("--resume", action="store_true", help="Repetir solo las semanas que la ejecución anterior dejó fallidas o sin hacer (meta/run.json).")
+    parser.add_argument("--rps", type=float, default=DEFAULT_RPS, help=f"Peticiones por segundo por host, compartidas entre ligas (por defecto {DEFAULT_RPS}).")
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST, help=f"Ráfaga máxima de peticiones por host (por defecto {DEFAULT_BURST}).")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Descargas simultáneas por liga (por defecto {DEFAULT_WORKERS}).")
+    parser.add_argument("--no-sleep", action="store_true", help="Sin límite de peticiones (útil para pruebas locales).")
+    parser.add_argument("--report", type=Path, help="Guardar también el informe JSON de la ejecución en este fichero.")
+    parser.add_argument("--profile", type=Path, metavar="DIR", help="Perfilar cada liga con cProfile y guardar DIR/<liga>.prof.")
+    parser.add_argument("--watch", action="store_true", help="No terminar: consultar las jornadas con partidos en juego hasta Ctrl+C.")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help=f"Segundos entre consultas en --watch con partidos en juego (por defecto {DEFAULT_INTERVAL}).")
+    parser.add_argument("--watch-for", type=float, default=0, metavar="MIN", help="Duración máxima de --watch en minutos (por defecto, sin límite).")
+    args = parser.parse_args(argv)
+
+    # Varios hilos/procesos escriben a la vez: cada print sale en una sola
+    # escritura de línea (con PYTHONUNBUFFERED el salto de línea iría aparte).
+    sys.stdout.reconfigure(line_buffering=True, write_through=False)
+
+    slugs = args.league or list(LEAGUES)
+    opts = RunOptions(
+        weeks=parse_week_args(args.week, slugs),
+        max_workers=args.workers,
+        force=args.force,
+        resume=args.resume,
+        rate=0 if args.no_sleep else args.rps,
+        burst=args.burst,
+        profile_dir=args.profile,
+        watch=args.watch,
+        interval=args.interval,
+        watch_for=args.watch_for,
+    )
+
+    started = utc_now_iso()
+    t0 = time.perf_counter()
+    leagues = run(slugs, opts)
+    report = {
+        "started": started,
+        "wall_s": round(time.perf_counter() - t0, 4),
+        "ok": all(r.get("status") == "ok" for r in leagues),
+        "leagues": leagues,
+    }
+    print_report(report, args.report)
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""
+Utilidades compartidas por los scrapers de football/ (fetch_api_1.py, fetch_api_2.py).
+
+Los scripts se ejecutan como `python football/fetch_api_X.py`, así que football/
+está en sys.path y este paquete se importa como `scraper`.
+"""
@@ -0,0 +1,159 @@
+"""
+Backfill reanudable de temporadas pasadas.
+
+Cada temporada se descarga en data/<liga>/seasons/<año>/:
+
+    weeks/week_{n}.json        filas de la jornada, escritas según llegan
+    checkpoint.json            jornadas hechas / fallidas y si la temporada está completa
+    matches_<liga>_<año>.json  mismo formato que matches_<liga>.json, al completarse
+
+Si se interrumpe, la siguiente ejecución solo pide las jornadas que faltan.
+La memoria no depende del número de temporadas: como mucho hay `max_workers`
+jornadas en vuelo y el fichero final se compone jornada a jornada desde disco.
+"""
+import dataclasses
+import json
+import os
+from pathlib import Path
+
+from scraper import metrics
+from scraper.canonical import write_atomic
+from scraper.concurrency import DEFAULT_WORKERS, iter_concurrently
+from scraper.leagues import LeagueConfig
+from scraper.meta_store import utc_now_iso
+from scraper.pipeline import fetch_week_json
+from scraper.store import open_store
+
+CHECKPOINT_FILE = "checkpoint.json"
+WEEKS_DIR = "weeks"
+
+
+# =========================
+# FICHEROS
+# =========================
+def season_dir(cfg: LeagueConfig, season: int) -> Path:
+    return cfg.seasons_dir / str(season)
+
+
+def season_json_path(cfg: LeagueConfig, season: int) -> Path:
+    return season_dir(cfg, season) / f"matches_{cfg.slug}_{season}.json"
+
+
+def load_checkpoint(cfg: LeagueConfig, season: int, total: int) -> dict:
+    path = season_dir(cfg, season) / CHECKPOINT_FILE
+    try:
+        cp = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cp = {}
+    return {
+        "season": season,
+        "weeks": total,
+        "done": cp.get("done", {}),          # "n" -> nº de partidos
+        "failed": cp.get("failed", []),
+        "complete": cp.get("complete", False),
+        "updated": cp.get("updated"),
+    }
+
+
+def save_checkpoint(cfg: LeagueConfig, cp: dict):
+    cp["updated"] = utc_now_iso()
+    cp["done"] = dict(sorted(cp["done"].items(), key=lambda kv: int(kv[0])))
+    cp["failed"] = sorted(set(cp["failed"]))
+    write_atomic(season_dir(cfg, cp["season"]) / CHECKPOINT_FILE, json.dumps(cp, ensure_ascii=False, indent=1))
+
+
+def _week_path(cfg: LeagueConfig, season: int, week: int) -> Path:
+    return season_dir(cfg, season) / WEEKS_DIR / f"week_{week}.json"
+
+
+def assemble_season(cfg: LeagueConfig, season: int, total: int) -> Path:
+    """Compone matches_<liga>_<año>.json leyendo una jornada cada vez."""
+    path = season_json_path(cfg, season)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as out:
+        out.write("{")
+        for week in range(1, total + 1):
+            rows = _week_path(cfg, season, week).read_text(encoding="utf-8")
+            out.write(("," if week > 1 else "") + f'\n"{week}":{rows}')
+        out.write("\n}\n")
+    os.replace(tmp, path)
+    return path
+
+
+def store_season(cfg: LeagueConfig, season: int, total: int):
+    """Vuelca la temporada al almacén SQLite (si FOOTBALL_STORE está configurado), jornada a jornada."""
+    store = open_store()
+    if store is None:
+        return
+    with store:
+        rows = sum(
+            store.upsert_week(cfg.slug, season, week, json.loads(_week_path(cfg, season, week).read_text(encoding="utf-8")))
+            for week in range(1, total + 1)
+        )
+    print(f"🗄️ [{cfg.name}] Temporada {season} en el almacén ({rows} filas cambiadas).")
+
+
+# =========================
+# DESCARGA
+# =========================
+def backfill_season(cfg: LeagueConfig, season: int, weeks: int | None = None,
+                    max_workers: int = DEFAULT_WORKERS, force: bool = False) -> bool:
+    """Descarga las jornadas que falten de una temporada. Devuelve True si queda completa."""
+    total = weeks or cfg.season_weeks
+    m = metrics.for_league(cfg.slug)
+    season_cfg = dataclasses.replace(cfg, base_week_url=cfg.season_week_url(season))
+    (season_dir(cfg, season) / WEEKS_DIR).mkdir(parents=True, exist_ok=True)
+
+    cp = load_checkpoint(cfg, season, total)
+    if force:
+        cp.update(weeks=total, done={}, failed=[], complete=False)
+    elif cp["complete"]:
+        print(f"⏭️ [{cfg.name}] Temporada {season}: ya completa.")
+        return True
+
+    pending = [
+        w for w in range(1, total + 1)
+        if str(w) not in cp["done"] or not _week_path(cfg, season, w).exists()
+    ]
+    print(f"📚 [{cfg.name}] Temporada {season}: {total - len(pending)}/{total} jornadas ya hechas; pidiendo {len(pending)}.")
+    m.count_week("planned", len(pending))
+    cp["failed"] = []
+
+    def _fetch(week: int) -> list[dict]:
+        data = fetch_week_json(season_cfg, week, use_cache=False)
+        return season_cfg.adapter.extract_rows(season_cfg.adapter.parse_matches(data), week)
+
+    for week, rows, exc in iter_concurrently(_fetch, pending, max_workers):
+        if exc is not None:
+            print(f"❌ [{cfg.name}] Temporada {season}, semana {week}: {exc}")
+            cp["failed"].append(week)
+            m.count_week("failed")
+        else:
+            raw = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+            write_atomic(_week_path(cfg, season, week), raw)
+            m.record_write(len(raw.encode("utf-8")))
+            cp["done"][str(week)] = len(rows)
+            m.count_week("changed")
+        # Checkpoint tras cada jornada: una interrupción pierde como mucho las que estaban en vuelo
+        save_checkpoint(cfg, cp)
+
+    if cp["failed"]:
+        print(f"⚠️ [{cfg.name}] Temporada {season}: faltan {cp['failed']}; se reintentarán en la próxima ejecución.")
+        return False
+
+    path = assemble_season(cfg, season, total)
+    store_season(cfg, season, total)
+    cp["complete"] = True
+    save_checkpoint(cfg, cp)
+    print(f"✅ [{cfg.name}] Temporada {season} completa: {path}")
+    return True
+
+
+def backfill(cfg: LeagueConfig, seasons: list[int], weeks: int | None = None,
+             max_workers: int = DEFAULT_WORKERS, force: bool = False) -> list[int]:
+    """Backfill de varias temporadas, una detrás de otra. Devuelve las que quedan incompletas."""
+    incomplete = []
+    for season in seasons:
+        if not backfill_season(cfg, season, weeks=weeks, max_workers=max_workers, force=force):
+            incomplete.append(season)
+    return incomplete
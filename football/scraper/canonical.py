@@ -0,0 +1,69 @@
+"""
+Serialización canónica de las salidas que se commitean en football/data.
+
+El mismo contenido produce siempre los mismos bytes: claves ordenadas, partidos
+ordenados (kickoff y equipo local), jornadas en orden numérico y sin campos
+volátiles de la respuesta (marcas de tiempo del servidor y similares). Así un
+commit de datos solo contiene cambios reales.
+"""
+import json
+import os
+import re
+from pathlib import Path
+
+# Campos que cambian en cada respuesta sin que cambie el partido
+VOLATILE_KEYS = frozenset({
+    "lastUpdated", "last_updated", "updatedAt", "updated_at",
+    "lastModified", "last_modified", "generatedAt", "generated_at",
+    "serverTime", "server_time", "timestamp", "cacheTime",
+})
+
+_FECHA = re.compile(r"(\d{2})-(\d{2})-(\d{4})")
+_SCORE = re.compile(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
+
+
+def dumps(obj, indent: int | None = 2, sort_keys: bool = True) -> str:
+    """
+    JSON canónico: claves ordenadas, UTF-8 sin escapar y salto de línea final.
+    sort_keys=False solo para objetos cuyo orden ya es fijo (p. ej. las filas,
+    que siempre se construyen con las mismas claves en el mismo orden).
+    """
+    if indent is None:
+        return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, separators=(",", ":"))
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, indent=indent) + "\n"
+
+
+def write_atomic(path: Path, data: str | bytes):
+    """Escribe en un temporal y lo renombra: nunca queda un fichero a medias."""
+    tmp = path.with_name(path.name + ".tmp")
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def strip_volatile(obj, keys: frozenset = VOLATILE_KEYS):
+    """Copia de obj sin las claves volátiles, a cualquier profundidad."""
+    if isinstance(obj, dict):
+        return {k: strip_volatile(v, keys) for k, v in obj.items() if k not in keys}
+    if isinstance(obj, list):
+        return [strip_volatile(v, keys) for v in obj]
+    return obj
+
+
+def row_sort_key(row: dict) -> tuple[str, str, str]:
+    """Orden de las filas: 'Sáb 16-08-2025' + '21:00' + local."""
+    m = _FECHA.search(row.get("Fecha") or "")
+    day = f"{m.group(3)}-{m.group(2)}-{m.group(1)}" if m else ""
+    return (day, row.get("Horario") or "", row.get("Local") or "")
+
+
+def parse_score(resultado: str | None) -> tuple[int, int] | None:
+    """'2 - 1' -> (2, 1); None si aún no hay resultado ('VS', vacío...)."""
+    m = _SCORE.match(resultado or "")
+    return (int(m.group(1)), int(m.group(2))) if m else None
+
+
+def sort_weeks(all_weeks: dict[str, list[dict]]) -> dict[str, list[dict]]:
+    """Jornadas en orden numérico y filas de cada jornada en orden de row_sort_key."""
+    return {key: sorted(all_weeks[key], key=row_sort_key) for key in sorted(all_weeks, key=int)}
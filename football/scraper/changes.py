@@ -0,0 +1,84 @@
+"""
+Registro de cambios (solo se añade) de partidos y resultados por liga.
+
+Cada vez que matches_<liga>.json cambia, se comparan las filas anteriores y las
+nuevas de las jornadas afectadas y se añade una línea a changes.jsonl por cada
+evento:
+
+    {"run": ..., "league": ..., "type": "result",  "jornada", "local", "visitante", "from", "to"}
+    {"run": ..., "league": ..., "type": "kickoff", ..., "from": {"fecha", "horario"}, "to": {...}}
+    {"run": ..., "league": ..., "type": "added" | "removed", ..., "fecha", "horario", "resultado"}
+
+Un partido se identifica por (jornada, local, visitante). Quien consuma el
+registro (avisos, cachés, la web) solo lee las líneas nuevas desde su última
+posición en vez de volver a comparar la temporada entera.
+"""
+import json
+from pathlib import Path
+
+from scraper.meta_store import utc_now_iso
+
+CHANGES_FILE = "changes.jsonl"
+
+
+def changes_path(league_dir: Path) -> Path:
+    return league_dir / CHANGES_FILE
+
+
+def _by_match(rows: list[dict]) -> dict[tuple[str, str], dict]:
+    return {(r.get("Local") or "", r.get("Visitante") or ""): r for r in rows}
+
+
+def _match_fields(jornada: int, key: tuple[str, str]) -> dict:
+    return {"jornada": jornada, "local": key[0], "visitante": key[1]}
+
+
+def diff_week(jornada: int, old_rows: list[dict], new_rows: list[dict]) -> list[dict]:
+    old, new = _by_match(old_rows), _by_match(new_rows)
+    events = []
+    for key in sorted(old.keys() | new.keys()):
+        before, after = old.get(key), new.get(key)
+        if before is None or after is None:
+            row = after or before
+            events.append({
+                "type": "added" if before is None else "removed",
+                **_match_fields(jornada, key),
+                "fecha": row.get("Fecha"), "horario": row.get("Horario"), "resultado": row.get("Resultado"),
+            })
+            continue
+        if (before.get("Fecha"), before.get("Horario")) != (after.get("Fecha"), after.get("Horario")):
+            events.append({
+                "type": "kickoff", **_match_fields(jornada, key),
+                "from": {"fecha": before.get("Fecha"), "horario": before.get("Horario")},
+                "to": {"fecha": after.get("Fecha"), "horario": after.get("Horario")},
+            })
+        if before.get("Resultado") != after.get("Resultado"):
+            events.append({
+                "type": "result", **_match_fields(jornada, key),
+                "from": before.get("Resultado"), "to": after.get("Resultado"),
+            })
+    return events
+
+
+def diff_weeks(old: dict[str, list[dict]], new: dict[str, list[dict]], weeks=None) -> list[dict]:
+    """Eventos entre dos versiones de matches_<liga>.json (weeks = jornadas a comparar; None = todas)."""
+    keys = {str(w) for w in weeks} if weeks is not None else old.keys() | new.keys()
+    events = []
+    for key in sorted(keys, key=int):
+        events += diff_week(int(key), old.get(key, []), new.get(key, []))
+    return events
+
+
+def append_changes(league_dir: Path, league: str, events: list[dict], run: str | None = None) -> int:
+    """Añade los eventos a changes.jsonl con la marca de la ejecución. Devuelve cuántos."""
+    if not events:
+        return 0
+    run = run or utc_now_iso()
+    lines = "".join(
+        json.dumps({"run": run, "league": league, **e}, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for e in events
+    )
+    league_dir.mkdir(parents=True, exist_ok=True)
+    with open(changes_path(league_dir), "a", encoding="utf-8") as f:
+        f.write(lines)
+    return len(events)
@@ -0,0 +1,148 @@
+"""
+Checkpoint de la última ejecución de cada liga (meta/run.json).
+
+    {"started", "updated", "current_week", "detect_failed": [...],
+     "planned": [...], "done": [...], "failed": {"n": {"error", "attempts", "at"}},
+     "breaker": "closed" | "open", "complete": bool}
+
+Se guarda al planificar, tras cada lote escrito y al terminar, así que tras un
+fallo o una interrupción `run.py --resume` sabe qué jornadas quedaron sin hacer
+y por qué, y solo pide esas.
+
+Un mismo RunCheckpoint hace de presupuesto de fallos y de circuit breaker: con
+BREAKER_THRESHOLD fallos seguidos, o FAILURE_BUDGET en total, el circuito se
+abre y el resto de jornadas se dan por fallidas sin gastar peticiones (cuota).
+Solo cuentan los fallos de caída (red, timeout, 429, 5xx): un 404 es una
+jornada fallida más, pero la API ha respondido.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+
+from scraper.canonical import write_atomic
+from scraper.meta_store import utc_now_iso
+
+RUN_FILE = "run.json"
+FAILURE_BUDGET = int(os.environ.get("SCRAPER_FAILURE_BUDGET", "10"))      # fallos por ejecución y liga
+BREAKER_THRESHOLD = int(os.environ.get("SCRAPER_BREAKER_THRESHOLD", "4"))  # fallos seguidos que abren el circuito
+BREAKER_REASON = "circuito abierto: la API no responde"
+
+
+class RunCheckpoint:
+    def __init__(self, path: Path, state: dict | None = None):
+        self.path = path
+        state = state or {}
+        self.started: str = state.get("started") or utc_now_iso()
+        self.current_week: int | None = state.get("current_week")
+        self.detect_failed: list[int] = list(state.get("detect_failed", []))
+        self.planned: list[int] = list(state.get("planned", []))
+        self.done: set[int] = set(state.get("done", []))
+        self.failed: dict[int, dict] = {int(w): dict(f) for w, f in state.get("failed", {}).items()}
+        self.complete: bool = state.get("complete", False)
+        self._breaker_open = False  # cada ejecución (también --resume) empieza con el circuito cerrado
+        self._failures = 0          # en esta ejecución
+        self._streak = 0
+        self._lock = threading.Lock()
+
+    # ---------- ficheros ----------
+    @classmethod
+    def load(cls, meta_dir: Path) -> "RunCheckpoint | None":
+        path = meta_dir / RUN_FILE
+        try:
+            return cls(path, json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def new(cls, meta_dir: Path) -> "RunCheckpoint":
+        return cls(meta_dir / RUN_FILE)
+
+    def save(self):
+        with self._lock:
+            payload = {
+                "started": self.started,
+                "updated": utc_now_iso(),
+                "current_week": self.current_week,
+                "detect_failed": sorted(self.detect_failed),
+                "planned": self.planned,
+                "done": sorted(self.done),
+                "failed": {str(w): f for w, f in sorted(self.failed.items())},
+                "breaker": "open" if self._breaker_open else "closed",
+                "complete": self.complete,
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path, json.dumps(payload, ensure_ascii=False, indent=1))
+
+    # ---------- plan ----------
+    def plan(self, current_week: int, weeks: list[int]):
+        with self._lock:
+            self.current_week = current_week
+            self.planned = sorted(set(self.planned) | set(weeks))
+            self.complete = False
+
+    def pending(self) -> list[int]:
+        """Jornadas que una ejecución con --resume debe volver a pedir."""
+        with self._lock:
+            return sorted(set(self.failed) | (set(self.planned) - self.done))
+
+    def finish(self):
+        with self._lock:
+            self.complete = not self.failed and not self.detect_failed and set(self.planned) <= self.done
+
+    # ---------- resultados ----------
+    def allow(self) -> bool:
+        """False si el circuito está abierto: no se hacen más peticiones en esta ejecución."""
+        with self._lock:
+            return not self._breaker_open
+
+    @property
+    def breaker_open(self) -> bool:
+        return not self.allow()
+
+    def succeeded(self, week: int | None = None):
+        """Respuesta correcta de la API (cierra la racha de fallos). Con week, la jornada queda hecha."""
+        with self._lock:
+            self._streak = 0
+            if week is not None:
+                self.done.add(week)
+                self.failed.pop(week, None)
+
+    def failed_week(self, week: int, error: str, attempted: bool = True, outage: bool = True):
+        """
+        Registra el fallo de una jornada. Si es de caída (outage), cuenta para el
+        circuito, que se abre al agotar el presupuesto.
+        """
+        with self._lock:
+            prev = self.failed.get(week, {})
+            self.failed[week] = {
+                "error": error,
+                "attempts": prev.get("attempts", 0) + (1 if attempted else 0),
+                "at": utc_now_iso(),
+            }
+            self.done.discard(week)
+            if attempted:
+                self._count_failure(outage)
+
+    def failed_request(self, outage: bool = True):
+        """Fallo de una petición que no es de una jornada del plan (p. ej. el calendario)."""
+        with self._lock:
+            self._count_failure(outage)
+
+    def _count_failure(self, outage: bool):
+        if not outage:
+            self._streak = 0   # la API ha respondido: no está caída
+            return
+        self._failures += 1
+        self._streak += 1
+        if self._streak >= BREAKER_THRESHOLD or self._failures >= FAILURE_BUDGET:
+            self._breaker_open = True
+
+    def summary(self) -> str:
+        with self._lock:
+            parts = [f"{len(self.done)}/{len(self.planned)} hechas"]
+            if self.failed:
+                parts.append(f"fallidas {sorted(self.failed)}")
+            if self._breaker_open:
+                parts.append("circuito abierto")
+            return ", ".join(parts)
@@ -0,0 +1,110 @@
+"""
+Formato compacto de matches_<liga>.json, por columnas y con diccionarios.
+
+    matches_<liga>.min.json      {"v", "league", "teams", "dates", "times", "n", "cols"}
+    matches_<liga>.min.json.gz   gzip (mtime fijo: mismos datos, mismos bytes)
+    matches_<liga>.min.json.br   brotli, solo si está instalado (pip install brotli)
+
+Se genera por defecto; FOOTBALL_COMPACT=0 lo desactiva.
+
+cols (una posición por partido, en el orden de matches_<liga>.json):
+
+    j       jornada
+    f, h    índices en dates / times (Fecha y Horario exactos)
+    k       kickoff en segundos epoch UTC (null si el horario es --:--)
+    l, a    índices en teams (local / visitante)
+    gl, ga  goles (null si aún no hay resultado)
+"""
+import gzip
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from scraper.canonical import parse_score, row_sort_key, write_atomic
+from scraper.normalize import TZ_MADRID
+
+try:
+    import brotli
+except ImportError:  # opcional
+    brotli = None
+
+COMPACT_VERSION = 1
+COMPACT_ENABLED = os.environ.get("FOOTBALL_COMPACT", "1") != "0"   # FOOTBALL_COMPACT=0 lo desactiva
+
+
+def compact_path(league_dir: Path, slug: str) -> Path:
+    return league_dir / f"matches_{slug}.min.json"
+
+
+def kickoff_epoch(row: dict) -> int | None:
+    day, hora, _ = row_sort_key(row)
+    if not day or not hora or hora == "--:--":
+        return None
+    try:
+        return int(datetime.strptime(f"{day} {hora}", "%Y-%m-%d %H:%M").replace(tzinfo=TZ_MADRID).timestamp())
+    except ValueError:
+        return None
+
+
+def encode(all_weeks: dict[str, list[dict]], league: str) -> dict:
+    dicts: dict[str, dict[str, int]] = {"teams": {}, "dates": {}, "times": {}}
+
+    def idx(kind: str, value: str) -> int:
+        table = dicts[kind]
+        if value not in table:
+            table[value] = len(table)
+        return table[value]
+
+    cols = {k: [] for k in ("j", "f", "h", "k", "l", "a", "gl", "ga")}
+    for key in sorted(all_weeks, key=int):
+        for row in all_weeks[key]:
+            gl, ga = parse_score(row.get("Resultado")) or (None, None)
+            cols["j"].append(int(row.get("Jornada") or key))
+            cols["f"].append(idx("dates", row.get("Fecha") or ""))
+            cols["h"].append(idx("times", row.get("Horario") or ""))
+            cols["k"].append(kickoff_epoch(row))
+            cols["l"].append(idx("teams", row.get("Local") or ""))
+            cols["a"].append(idx("teams", row.get("Visitante") or ""))
+            cols["gl"].append(gl)
+            cols["ga"].append(ga)
+    return {
+        "v": COMPACT_VERSION,
+        "league": league,
+        **{kind: list(table) for kind, table in dicts.items()},
+        "n": len(cols["j"]),
+        "cols": cols,
+    }
+
+
+def decode(payload: dict) -> dict[str, list[dict]]:
+    """Inverso de encode: {jornada: filas}, igual que matches_<liga>.json."""
+    c, teams, dates, times = payload["cols"], payload["teams"], payload["dates"], payload["times"]
+    all_weeks: dict[str, list[dict]] = {}
+    for i in range(payload["n"]):
+        gl, ga = c["gl"][i], c["ga"][i]
+        all_weeks.setdefault(str(c["j"][i]), []).append({
+            "Jornada": c["j"][i],
+            "Fecha": dates[c["f"][i]],
+            "Horario": times[c["h"][i]],
+            "Local": teams[c["l"][i]],
+            "Resultado": f"{gl} - {ga}" if gl is not None and ga is not None else "VS",
+            "Visitante": teams[c["a"][i]],
+        })
+    return all_weeks
+
+
+def write_compact(league_dir: Path, slug: str, all_weeks: dict[str, list[dict]]) -> list[Path]:
+    """Escribe la versión compacta y sus variantes comprimidas si cambian. Devuelve las escritas."""
+    raw = json.dumps(encode(all_weeks, slug), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    path = compact_path(league_dir, slug)
+    if path.exists() and path.read_bytes() == raw:
+        return []
+    variants = {path.with_name(path.name + ".gz"): gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[path.with_name(path.name + ".br")] = brotli.compress(raw, quality=11)
+    # El .min.json el último: es lo que se compara, así que si algo falla antes se repite todo
+    variants[path] = raw
+    for p, data in variants.items():
+        write_atomic(p, data)
+    return list(variants)
@@ -0,0 +1,299 @@
+"""
+Descarga concurrente con límite de peticiones por host (token bucket).
+
+Sustituye las esperas aleatorias de 35-50 s entre semanas: las peticiones salen
+en paralelo, pero cada host tiene un presupuesto de peticiones/segundo y una
+ráfaga máxima que nunca se supera, aunque haya varias ligas en marcha a la vez.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+# =========================
+# CONFIG
+# =========================
+DEFAULT_RPS = float(os.environ.get("SCRAPER_RPS", "2"))       # peticiones/segundo por host
+DEFAULT_BURST = int(os.environ.get("SCRAPER_BURST", "4"))     # ráfaga máxima por host
+DEFAULT_WORKERS = int(os.environ.get("SCRAPER_WORKERS", "4")) # hilos por liga
+STAGE_QUEUE = 8                                                # capacidad de las colas entre etapas
+
+
+# =========================
+# TOKEN BUCKET
+# =========================
+class TokenBucket:
+    """
+    Cubo de tokens thread-safe. Cada petición consume un token; el cubo se
+    rellena a `rate` tokens/segundo hasta un máximo de `burst`.
+    Con rate <= 0 no limita (equivalente al antiguo --no-sleep).
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_take(self, tokens: float) -> float:
+        """Consume `tokens` si hay; si no, devuelve los segundos que faltan."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0):
+        if self.rate <= 0:
+            return
+        while True:
+            wait = self._try_take(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    TokenBucket con el estado en memoria compartida: un mismo presupuesto por
+    host para varios procesos (una liga por proceso). Se crea en el proceso
+    padre y se pasa a los hijos al lanzarlos.
+    """
+
+    def __init__(self, rate: float, burst: int, ctx=None):
+        # Sin threading.Lock propio: el Array compartido trae el suyo y así el
+        # objeto se puede pasar a procesos lanzados con "spawn".
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        ctx = ctx or multiprocessing.get_context()
+        # [tokens, último relleno]; time.monotonic() es común a todo el sistema
+        self._state = ctx.Array("d", [float(self.burst), time.monotonic()])
+
+    def _try_take(self, tokens: float) -> float:
+        with self._state.get_lock():
+            now = time.monotonic()
+            available = min(self.burst, self._state[0] + (now - self._state[1]) * self.rate)
+            self._state[1] = now
+            if available >= tokens:
+                self._state[0] = available - tokens
+                return 0.0
+            self._state[0] = available
+            return (tokens - available) / self.rate
+
+
+# =========================
+# REGISTRO POR HOST
+# =========================
+_BUCKETS: dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+_RATE = DEFAULT_RPS
+_BURST = DEFAULT_BURST
+
+
+def configure(rate: float | None = None, burst: int | None = None):
+    """Fija el presupuesto por host. Reinicia los cubos ya creados."""
+    global _RATE, _BURST
+    with _BUCKETS_LOCK:
+        if rate is not None:
+            _RATE = rate
+        if burst is not None:
+            _BURST = burst
+        _BUCKETS.clear()
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def shared_buckets(urls, rate: float | None = None, burst: int | None = None, ctx=None) -> dict[str, SharedTokenBucket]:
+    """Un SharedTokenBucket por host distinto de `urls`, para repartir entre procesos."""
+    rate = _RATE if rate is None else rate
+    burst = _BURST if burst is None else burst
+    return {host: SharedTokenBucket(rate, burst, ctx) for host in {host_of(u) for u in urls if u}}
+
+
+def install_buckets(buckets: dict[str, TokenBucket]):
+    """Usa estos cubos (p. ej. compartidos con otros procesos) para sus hosts."""
+    with _BUCKETS_LOCK:
+        _BUCKETS.update(buckets)
+
+
+def limiter_for(url: str) -> TokenBucket:
+    """Devuelve el cubo compartido del host de `url` (lo crea si no existe)."""
+    host = host_of(url)
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(host)
+        if bucket is None:
+            bucket = _BUCKETS[host] = TokenBucket(_RATE, _BURST)
+        return bucket
+
+
+# =========================
+# EJECUCIÓN CONCURRENTE
+# =========================
+def map_concurrently(fn, items, max_workers: int = DEFAULT_WORKERS) -> list:
+    """
+    Ejecuta fn(item) en un pool acotado de hilos y devuelve los resultados en
+    el mismo orden que `items`. Las excepciones se propagan al llamador.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+        return [fn(it) for it in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def iter_concurrently(fn, items, max_workers: int = DEFAULT_WORKERS):
+    """
+    Como map_concurrently, pero genera (item, resultado, excepción) según van
+    terminando y nunca tiene más de max_workers tareas en vuelo: la memoria no
+    crece con el número de items (items puede ser un iterador largo).
+    """
+    it = iter(items)
+    workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        for item in it:
+            running[pool.submit(fn, item)] = item
+            if len(running) >= workers:
+                break
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                item = running.pop(fut)
+                exc = fut.exception()
+                yield item, (None if exc else fut.result()), exc
+                nxt = next(it, _END)
+                if nxt is not _END:
+                    running[pool.submit(fn, nxt)] = nxt
+
+
+_END = object()
+
+
+# =========================
+# ETAPAS: fetch -> parse -> write
+# =========================
+def run_stages(items, fetch, parse, write, max_workers: int = DEFAULT_WORKERS,
+               queue_size: int = STAGE_QUEUE, cancel: threading.Event | None = None):
+    """
+    Pipeline por etapas con colas acotadas:
+
+        fetch(item)       en max_workers hilos (red)
+        parse(item, x)    en un hilo (CPU)
+        write(lote)       en un hilo, con lotes [(item, y), ...] de hasta queue_size
+
+    fetch/parse devuelven None para no pasar nada a la siguiente etapa. Si una
+    cola se llena, la etapa anterior espera (contrapresión): nunca hay más de
+    ~2 * queue_size resultados en memoria. Una excepción en cualquier etapa, o
+    `cancel`, para las descargas pendientes; lo ya descargado se parsea y lo ya
+    parseado se escribe igual (salvo en la etapa que ha fallado), y la
+    excepción se relanza al final.
+    """
+    cancel = cancel or threading.Event()
+    todo: queue.SimpleQueue = queue.SimpleQueue()
+    for item in items:
+        todo.put(item)
+    fetched: queue.Queue = queue.Queue(queue_size)
+    parsed: queue.Queue = queue.Queue(queue_size)
+    errors: list[BaseException] = []
+    write_failed = threading.Event()   # sin escritor, nadie vacía `parsed`
+
+    def fail(exc: BaseException):
+        errors.append(exc)
+        cancel.set()
+
+    def put(q: queue.Queue, value, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(q: queue.Queue):
+        while True:
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                if cancel.is_set():
+                    return _END
+
+    def fetcher():
+        while not cancel.is_set():
+            try:
+                item = todo.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                out = fetch(item)
+            except BaseException as e:
+                return fail(e)
+            if out is not None and not put(fetched, (item, out), cancel):
+                return
+
+    def parser():
+        try:
+            # Tras cancel, get() sigue entregando lo que ya está en la cola
+            while (entry := get(fetched)) is not _END:
+                try:
+                    out = parse(*entry)
+                except BaseException as e:
+                    return fail(e)
+                if out is not None and not put(parsed, (entry[0], out), write_failed):
+                    return
+        finally:
+            put(parsed, _END, write_failed)
+
+    def writer():
+        done = False
+        while not done:
+            entry = parsed.get()   # el parser siempre termina con _END
+            batch = []
+            while entry is not _END:
+                batch.append(entry)
+                if len(batch) >= queue_size:
+                    break
+                try:
+                    entry = parsed.get_nowait()
+                except queue.Empty:
+                    break
+            done = entry is _END
+            if batch:
+                try:
+                    write(batch)
+                except BaseException as e:
+                    write_failed.set()
+                    return fail(e)
+
+    fetchers = [threading.Thread(target=fetcher, daemon=True) for _ in range(max(1, max_workers))]
+    others = [threading.Thread(target=parser, daemon=True), threading.Thread(target=writer, daemon=True)]
+    for t in fetchers + others:
+        t.start()
+    try:
+        for t in fetchers:
+            while t.is_alive():
+                t.join(0.1)
+        put(fetched, _END, cancel)
+        for t in others:
+            while t.is_alive():
+                t.join(0.1)
+    except BaseException:
+        # Ctrl+C: sin descargas nuevas; se espera a que las etapas terminen lo que tienen
+        cancel.set()
+        for t in fetchers + others:
+            t.join()
+        raise
+    if errors:
+        raise errors[0]
@@ -0,0 +1,165 @@
+"""
+Cliente HTTP compartido por los fetchers.
+
+- Una sesión `requests` por proceso con pool de conexiones keep-alive.
+- Reintentos con backoff exponencial + jitter ante 429/5xx y errores de red,
+  respetando la cabecera Retry-After.
+- GET condicional completo: If-None-Match (ETag) e If-Modified-Since (Last-Modified).
+- Cada intento pasa por el limitador por host de scraper.concurrency.
+"""
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from scraper.concurrency import limiter_for
+
+# =========================
+# CONFIG
+# =========================
+DEFAULT_TIMEOUT = (5, 30)              # (conexión, lectura) en segundos
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0                     # segundos; se duplica en cada intento
+BACKOFF_MAX = 30.0
+RETRY_AFTER_MAX = 120.0                # nunca esperar más de esto por un Retry-After
+RETRY_STATUS = {429, 500, 502, 503, 504}
+POOL_SIZE = 16
+
+
+@dataclass
+class HttpResult:
+    status: int
+    data: object | None                # JSON decodificado (None si 304)
+    etag: str | None = None
+    last_modified: str | None = None
+    nbytes: int = 0                    # bytes del cuerpo recibido
+    attempts: int = 1                  # peticiones hechas (1 + reintentos)
+    decode_s: float = 0.0              # tiempo de resp.json()
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+# =========================
+# SESIÓN
+# =========================
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _SESSION = s
+        return _SESSION
+
+
+# =========================
+# BACKOFF
+# =========================
+def _retry_after_seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Retry-After si el servidor lo indica; si no, exponencial con jitter completo."""
+    hinted = _retry_after_seconds(retry_after)
+    if hinted is not None:
+        return min(hinted, RETRY_AFTER_MAX)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+# =========================
+# GET JSON
+# =========================
+def get_json(url: str, params: dict | None = None, etag: str | None = None,
+             last_modified: str | None = None, timeout=DEFAULT_TIMEOUT,
+             retries: int = MAX_RETRIES) -> HttpResult:
+    """
+    GET condicional de un recurso JSON. Devuelve HttpResult con status 304 y
+    data=None si el servidor confirma que no hay cambios. Lanza
+    requests.HTTPError / requests.RequestException cuando se agotan los reintentos.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    session = get_session()
+    attempt = 0
+    while True:
+        limiter_for(url).acquire()
+        try:
+            resp = session.get(url, params=params, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= retries:
+                raise
+            time.sleep(backoff_delay(attempt))
+            attempt += 1
+            continue
+
+        if resp.status_code in RETRY_STATUS and attempt < retries:
+            delay = backoff_delay(attempt, resp.headers.get("Retry-After"))
+            resp.close()
+            time.sleep(delay)
+            attempt += 1
+            continue
+        break
+
+    if resp.status_code == 304:
+        return HttpResult(
+            status=304,
+            data=None,
+            etag=resp.headers.get("ETag") or etag,
+            last_modified=resp.headers.get("Last-Modified") or last_modified,
+            attempts=attempt + 1,
+        )
+
+    resp.raise_for_status()
+    t0 = time.perf_counter()
+    data = resp.json()
+    return HttpResult(
+        status=resp.status_code,
+        data=data,
+        etag=resp.headers.get("ETag"),
+        last_modified=resp.headers.get("Last-Modified"),
+        nbytes=len(resp.content),
+        attempts=attempt + 1,
+        decode_s=time.perf_counter() - t0,
+    )
+
+
+def is_outage(exc: BaseException) -> bool:
+    """
+    True si el error indica que la API no responde (red, timeout, 429 o 5xx).
+    Un 404 u otro 4xx solo dice que ese recurso concreto está mal.
+    """
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status in RETRY_STATUS or status >= 500
+    return False
@@ -0,0 +1,166 @@
+"""
+Calendarios .ics estáticos por liga y por equipo.
+
+    ics/<liga>.ics     todos los partidos de la liga
+    ics/<equipo>.ics   partidos de un equipo (mismo slug que teams/)
+    ics/index.json     {"feeds": {slug: {"file", "hash", "events"}}}
+
+Cada evento lleva un UID estable (liga, jornada y equipos), así que los
+clientes suscritos actualizan el partido en lugar de duplicarlo. Un feed solo se
+regenera si cambian sus partidos (horario, resultado o un --:-- que pasa a
+tener hora); DTSTAMP es el momento de esa regeneración.
+"""
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from scraper.canonical import row_sort_key, write_atomic
+from scraper.meta_store import utc_now_iso
+from scraper.teams import team_slug
+
+ICS_DIR = "ics"
+INDEX_FILE = "index.json"
+MATCH_DURATION = timedelta(hours=2)
+
+_VTIMEZONE = [
+    "BEGIN:VTIMEZONE",
+    "TZID:Europe/Madrid",
+    "X-LIC-LOCATION:Europe/Madrid",
+    "BEGIN:DAYLIGHT",
+    "TZOFFSETFROM:+0100",
+    "TZOFFSETTO:+0200",
+    "TZNAME:CEST",
+    "DTSTART:19700329T020000",
+    "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU",
+    "END:DAYLIGHT",
+    "BEGIN:STANDARD",
+    "TZOFFSETFROM:+0200",
+    "TZOFFSETTO:+0100",
+    "TZNAME:CET",
+    "DTSTART:19701025T030000",
+    "RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+]
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _fold(line: str) -> str:
+    """Líneas de como mucho 75 octetos (RFC 5545), continuadas con un espacio."""
+    raw = line.encode("utf-8")
+    if len(raw) <= 75:
+        return line
+    parts, current = [], b""
+    for ch in line:
+        b = ch.encode("utf-8")
+        if len(current) + len(b) > (75 if not parts else 74):
+            parts.append(current.decode("utf-8"))
+            current = b""
+        current += b
+    parts.append(current.decode("utf-8"))
+    return "\r\n ".join(parts)
+
+
+def event_lines(league: str, row: dict, dtstamp: str) -> list[str]:
+    local, visitante = row.get("Local") or "", row.get("Visitante") or ""
+    day, hora, _ = row_sort_key(row)
+    if not day:
+        return []
+    uid = f"{league}-{row.get('Jornada')}-{team_slug(local)}-{team_slug(visitante)}@genosx10.github.io"
+    lines = ["BEGIN:VEVENT", f"UID:{uid}", f"DTSTAMP:{dtstamp}"]
+    start_day = datetime.strptime(day, "%Y-%m-%d")
+    if hora and hora != "--:--":
+        start = datetime.strptime(f"{day} {hora}", "%Y-%m-%d %H:%M")
+        end = start + MATCH_DURATION
+        lines += [f"DTSTART;TZID=Europe/Madrid:{start:%Y%m%dT%H%M%S}", f"DTEND;TZID=Europe/Madrid:{end:%Y%m%dT%H%M%S}"]
+    else:
+        # Sin horario definitivo: evento de día completo
+        lines += [f"DTSTART;VALUE=DATE:{start_day:%Y%m%d}", f"DTEND;VALUE=DATE:{start_day + timedelta(days=1):%Y%m%d}"]
+    resultado = row.get("Resultado") or "VS"
+    summary = f"{local} {resultado} {visitante}" if resultado != "VS" else f"{local} vs {visitante}"
+    lines += [f"SUMMARY:{_escape(summary)}", f"DESCRIPTION:Jornada {row.get('Jornada')}", "END:VEVENT"]
+    return lines
+
+
+def render_feed(league: str, name: str, rows: list[dict], dtstamp: str) -> str:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Calendario_Futbol//ES",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+        "X-WR-TIMEZONE:Europe/Madrid",
+        *_VTIMEZONE,
+    ]
+    for row in sorted(rows, key=row_sort_key):
+        lines += event_lines(league, row, dtstamp)
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(_fold(line) for line in lines) + "\r\n"
+
+
+def _fingerprint(rows: list[dict]) -> str:
+    raw = json.dumps(sorted(rows, key=row_sort_key), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def load_index(league_dir: Path) -> dict:
+    try:
+        return json.loads((league_dir / ICS_DIR / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_ics_feeds(league_dir: Path, league: str, league_name: str, all_weeks: dict[str, list[dict]],
+                    changed: set[int] | None = None) -> list[str]:
+    """
+    Sincroniza ics/ con all_weeks. changed = jornadas que han cambiado (None =
+    revisar todos los feeds). Devuelve los slugs de los feeds (re)escritos.
+    """
+    feeds: dict[str, tuple[str, list[dict]]] = {league: (league_name, [])}
+    for key in sorted(all_weeks, key=int):
+        for row in all_weeks[key]:
+            feeds[league][1].append(row)
+            for team in (row.get("Local"), row.get("Visitante")):
+                if team:
+                    feeds.setdefault(team_slug(team), (team, []))[1].append(row)
+
+    if changed is None:
+        candidates = set(feeds)
+    else:
+        candidates = {league} if changed else set()
+        for week in changed:
+            for row in all_weeks.get(str(week), []):
+                candidates.update(team_slug(t) for t in (row.get("Local"), row.get("Visitante")) if t)
+
+    old = load_index(league_dir).get("feeds", {})
+    ics_dir = league_dir / ICS_DIR
+    ics_dir.mkdir(parents=True, exist_ok=True)
+    dtstamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    entries, written = {}, []
+    for slug in sorted(feeds):
+        name, rows = feeds[slug]
+        prev = old.get(slug)
+        rel = f"{ICS_DIR}/{slug}.ics"
+        exists = (league_dir / rel).exists()
+        if slug not in candidates and prev and prev.get("events") == len(rows) and exists:
+            entries[slug] = prev
+            continue
+        digest = _fingerprint(rows)
+        if not prev or prev.get("hash") != digest or not exists:
+            write_atomic(league_dir / rel, render_feed(league, name, rows, dtstamp))
+            written.append(slug)
+        entries[slug] = {"file": rel, "hash": digest, "events": len(rows)}
+
+    for slug in set(old) - set(entries):
+        (league_dir / old[slug].get("file", f"{ICS_DIR}/{slug}.ics")).unlink(missing_ok=True)
+
+    if entries != old:
+        payload = {"updated": utc_now_iso(), "feeds": entries}
+        write_atomic(ics_dir / INDEX_FILE, json.dumps(payload, ensure_ascii=False, indent=1))
+    return written
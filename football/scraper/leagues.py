@@ -0,0 +1,303 @@
+"""
+Adaptadores de proveedor y registro de ligas.
+
+Cada proveedor de API se describe con un LeagueAdapter (cómo se construye la
+URL de una jornada y cómo se leen sus partidos). Una liga es un LeagueConfig que
+combina un adaptador con su URL base y sus rutas de salida. Añadir una liga =
+registrar un LeagueConfig (y, si el formato es nuevo, un adaptador).
+"""
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from . import canonical, normalize
+from .normalize import TZ_LONDON, TZ_MADRID, WEEKDAY_ABBR_ES  # noqa: F401  (reexportados)
+
+# =========================
+# CONFIG
+# =========================
+SEASON_WEEKS = 38          # jornadas por defecto (liga de 20 equipos)
+DATA_DIR = Path(os.environ.get("FOOTBALL_DATA_DIR", "football/data"))
+
+ROW_KEYS = ("Jornada", "Fecha", "Horario", "Local", "Resultado", "Visitante")
+
+
+# =========================
+# ADAPTADORES
+# =========================
+class LeagueAdapter:
+    """
+    Formato de un proveedor. Las subclases implementan el acceso a los campos
+    del partido; extract_row / extract_rows son comunes a todas.
+    """
+
+    payload_key = ""                         # envoltorio de la respuesta: {payload_key: [partidos]}
+    volatile_keys = canonical.VOLATILE_KEYS  # campos que se descartan al guardar
+    week_keys = ("week", "matchWeek", "gameweek", "round")   # jornada de cada partido en una respuesta de temporada
+
+    def week_request(self, base_week_url: str, week: int) -> tuple[str, dict | None]:
+        """(url, params) de la petición de una jornada."""
+        raise NotImplementedError
+
+    def season_request(self, bulk_url: str) -> tuple[str, dict | None]:
+        """(url, params) de la petición de toda la temporada, si el proveedor la admite."""
+        return bulk_url, None
+
+    def match_week(self, match) -> int | None:
+        """Jornada de un partido (número o {"week"/"number": n}); None si no la indica."""
+        for key in self.week_keys:
+            value = match.get(key)
+            if isinstance(value, dict):
+                value = value.get("week", value.get("number"))
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                continue
+        return None
+
+    def parse_matches(self, obj) -> list:
+        raise NotImplementedError
+
+    def match_kickoff(self, match) -> datetime | None:
+        raise NotImplementedError
+
+    def match_finished(self, match) -> bool:
+        raise NotImplementedError
+
+    def format_fecha_y_hora(self, raw: str) -> tuple[str, str]:
+        raise NotImplementedError
+
+    def kickoff_raw(self, match) -> str:
+        raise NotImplementedError
+
+    def team_names(self, match) -> tuple[str, str]:
+        raise NotImplementedError
+
+    def scores(self, match) -> tuple[object, object]:
+        raise NotImplementedError
+
+    def clean_team_name(self, name: str) -> str:
+        return normalize.collapse_spaces(name)
+
+    def match_sort_key(self, match) -> tuple[float, str]:
+        dt = self.match_kickoff(match)
+        return (dt.timestamp() if dt else float("inf"), self.team_names(match)[0])
+
+    def canonical_payload(self, data) -> dict:
+        """Respuesta reducida a sus partidos, sin campos volátiles y en orden (kickoff, local)."""
+        matches = [canonical.strip_volatile(m, self.volatile_keys) for m in self.parse_matches(data)]
+        matches.sort(key=self.match_sort_key)
+        return {self.payload_key: matches}
+
+    def resultado_partido(self, match) -> str:
+        if not self.match_finished(match):
+            return "VS"
+        hs, as_ = self.scores(match)
+        if isinstance(hs, int) and isinstance(as_, int):
+            return f"{hs} - {as_}"
+        return "VS"
+
+    def extract_row(self, match, week_label: str) -> list[str]:
+        fecha, hora = self.format_fecha_y_hora(self.kickoff_raw(match))
+        home, away = self.team_names(match)
+        local = self.clean_team_name(home)
+        visitante = self.clean_team_name(away)
+        resultado = self.resultado_partido(match)
+        return [str(week_label), fecha, hora, local, resultado, visitante]
+
+    def extract_rows(self, matches: list, week: int) -> list[dict]:
+        """Filas (dicts con ROW_KEYS) de toda una jornada en una sola llamada."""
+        kickoff_raw, fecha_y_hora = self.kickoff_raw, self.format_fecha_y_hora
+        team_names, clean, resultado = self.team_names, self.clean_team_name, self.resultado_partido
+        rows = []
+        for m in matches:
+            fecha, hora = fecha_y_hora(kickoff_raw(m))
+            home, away = team_names(m)
+            rows.append({
+                "Jornada": week,
+                "Fecha": fecha,
+                "Horario": hora,
+                "Local": clean(home),
+                "Resultado": resultado(m),
+                "Visitante": clean(away),
+            })
+        return rows
+
+
+class MatchesApiAdapter(LeagueAdapter):
+    """
+    API de LaLiga / LaLiga2: `{base}/week/{n}/matches` con subscription-key,
+    respuesta {"matches": [...]} y fechas ISO en UTC.
+    """
+
+    payload_key = "matches"
+
+    def __init__(self, subscription_key: str):
+        self.subscription_key = subscription_key
+
+    def _params(self) -> dict:
+        if not self.subscription_key:
+            raise RuntimeError("Falta SUBSCRIPTION_KEY.")
+        return {
+            "contentLanguage": "es",
+            "countryCode": "ES",
+            "subscription-key": self.subscription_key,
+        }
+
+    def week_request(self, base_week_url: str, week: int) -> tuple[str, dict | None]:
+        return f"{base_week_url}/week/{week}/matches", self._params()
+
+    def season_request(self, bulk_url: str) -> tuple[str, dict | None]:
+        return bulk_url, self._params()
+
+    def parse_matches(self, obj) -> list:
+        if isinstance(obj, dict) and isinstance(obj.get("matches"), list):
+            return obj["matches"]
+        if isinstance(obj, list):
+            return obj
+        return []
+
+    def kickoff_raw(self, match) -> str:
+        return match.get("date") or match.get("time") or ""
+
+    def match_kickoff(self, match) -> datetime | None:
+        return normalize.parse_utc_iso(self.kickoff_raw(match))
+
+    def format_fecha_y_hora(self, iso_str: str) -> tuple[str, str]:
+        return normalize.fecha_y_hora_utc_iso(iso_str)
+
+    def match_finished(self, match) -> bool:
+        return (match.get("status") or match.get("matchStatus")) == "FullTime"
+
+    def scores(self, match) -> tuple[object, object]:
+        return (
+            match.get("home_score", match.get("homeScore")),
+            match.get("away_score", match.get("awayScore")),
+        )
+
+    def team_names(self, match) -> tuple[str, str]:
+        home = match.get("home_team") or match.get("homeTeam") or {}
+        away = match.get("away_team") or match.get("awayTeam") or {}
+        return (
+            home.get("nickname") or home.get("name") or "",
+            away.get("nickname") or away.get("name") or "",
+        )
+
+    def clean_team_name(self, name: str) -> str:
+        return normalize.clean_team_name_es(name)
+
+
+class DataApiAdapter(LeagueAdapter):
+    """
+    API de la Premier League: URL con plantilla `{week}`, respuesta
+    {"data": [...]} y kickoff "YYYY-MM-DD HH:MM:SS" en hora de Londres.
+    """
+
+    payload_key = "data"
+
+    def week_request(self, base_week_url: str, week: int) -> tuple[str, dict | None]:
+        return base_week_url.replace("{week}", str(week)), None
+
+    def parse_matches(self, obj) -> list:
+        if isinstance(obj, dict) and isinstance(obj.get("data"), list):
+            return obj["data"]
+        if isinstance(obj, list):
+            return obj
+        return []
+
+    def kickoff_raw(self, match) -> str:
+        return match.get("kickoff", "")
+
+    def match_kickoff(self, match) -> datetime | None:
+        return normalize.parse_london(self.kickoff_raw(match))
+
+    def format_fecha_y_hora(self, iso_str: str) -> tuple[str, str]:
+        return normalize.fecha_y_hora_london(iso_str)
+
+    def match_finished(self, match) -> bool:
+        return match.get("period") == "FullTime"
+
+    def scores(self, match) -> tuple[object, object]:
+        return (
+            match.get("homeTeam", {}).get("score"),
+            match.get("awayTeam", {}).get("score"),
+        )
+
+    def team_names(self, match) -> tuple[str, str]:
+        return (
+            match.get("homeTeam", {}).get("name", ""),
+            match.get("awayTeam", {}).get("name", ""),
+        )
+
+
+# =========================
+# MODELO DE LIGA
+# =========================
+@dataclass
+class LeagueConfig:
+    name: str                 # etiqueta para logs: "LaLiga", "LaLiga2", etc.
+    slug: str                 # carpeta en data/: "laliga", "laliga2", "premier_league"
+    base_week_url: str        # valor de BASE_WEEK_URL_X
+    adapter: LeagueAdapter
+    url_env: str = ""         # nombre de la variable de entorno, para los mensajes
+    data_dir: Path = field(default=DATA_DIR)
+    season_weeks: int = SEASON_WEEKS
+    season_url: str = ""      # plantilla con {season} para temporadas pasadas (<url_env>_SEASON)
+    bulk_url: str = ""        # temporada entera en una petición, si la API lo permite (<url_env>_BULK)
+
+    @property
+    def league_dir(self) -> Path:
+        return self.data_dir / self.slug
+
+    @property
+    def out_dir_json(self) -> Path:
+        return self.league_dir / "json"
+
+    @property
+    def meta_dir(self) -> Path:
+        return self.league_dir / "meta"
+
+    @property
+    def main_json_path(self) -> Path:
+        return self.league_dir / f"matches_{self.slug}.json"
+
+    @property
+    def seasons_dir(self) -> Path:
+        return self.league_dir / "seasons"
+
+    def season_week_url(self, season: int) -> str:
+        """
+        URL base de una temporada pasada: {season} es el año de inicio (2023 para
+        la 2023-24) y {season_end} el de fin. El resto ({week}...) lo resuelve el adaptador.
+        """
+        if "{season" not in self.season_url:
+            raise RuntimeError(f"[{self.name}] Falta {self.url_env}_SEASON (URL con {{season}}).")
+        return self.season_url.replace("{season}", str(season)).replace("{season_end}", str(season + 1))
+
+
+# =========================
+# REGISTRO
+# =========================
+LEAGUES: dict[str, LeagueConfig] = {}
+
+
+def register(cfg: LeagueConfig) -> LeagueConfig:
+    LEAGUES[cfg.slug] = cfg
+    return cfg
+
+
+def _from_env(name: str, slug: str, url_env: str, adapter: LeagueAdapter, season_weeks: int = SEASON_WEEKS) -> LeagueConfig:
+    return register(LeagueConfig(
+        name, slug, os.environ.get(url_env, ""), adapter, url_env=url_env,
+        season_weeks=season_weeks, season_url=os.environ.get(f"{url_env}_SEASON", ""),
+        bulk_url=os.environ.get(f"{url_env}_BULK", ""),
+    ))
+
+
+_matches_api = MatchesApiAdapter(subscription_key=os.environ.get("SUBSCRIPTION_KEY", ""))
+_data_api = DataApiAdapter()
+
+_from_env("LaLiga", "laliga", "BASE_WEEK_URL_1", _matches_api)
+_from_env("LaLiga2", "laliga2", "BASE_WEEK_URL_2", _matches_api, season_weeks=42)   # 22 equipos
+_from_env("Premier League", "premier_league", "BASE_WEEK_URL_PREM", _data_api)
@@ -0,0 +1,169 @@
+"""
+Metadatos por liga en un único fichero meta/index.json.
+
+Sustituye los ficheros week_{n}.lastmod / week_{n}.etag (uno por semana): se
+carga una vez al empezar, se consulta en memoria y se escribe una sola vez al
+final de la ejecución. Por semana guarda:
+
+    lastmod, etag       validadores para el GET condicional
+    hash                hash del contenido descargado
+    fetched_at          última descarga que cambió el fichero de la semana (ISO UTC)
+    checked_at          última consulta correcta a la API, 200 o 304 (ISO UTC)
+    state               resumen de estado: {"matches": n, "finished": n, "next_kickoff": iso|null}
+
+checked_at cambia en cada ejecución aunque los datos no cambien, así que se
+guarda aparte en meta/checks.json: index.json solo cambia cuando cambian los
+datos y checks.json no se commitea (.gitignore; el workflow lo conserva entre
+ejecuciones con la caché de Actions). fetched_at va en
+index.json: cambia junto con el hash y, en un checkout sin checks.json, sirve
+de última comprobación conocida para el plan de refresco.
+"""
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from scraper.canonical import write_atomic
+
+INDEX_FILE = "index.json"
+CHECKS_FILE = "checks.json"
+WEEK_FIELDS = ("lastmod", "etag", "hash", "fetched_at", "checked_at", "state")
+VOLATILE_FIELDS = ("checked_at",)   # van a CHECKS_FILE
+_LEGACY_KINDS = {"lastmod": "lastmod", "etag": "etag"}
+
+
+class MetaStore:
+    _instances: dict[Path, "MetaStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, meta_dir: Path):
+        self.meta_dir = meta_dir
+        self.path = meta_dir / INDEX_FILE
+        self.checks_path = meta_dir / CHECKS_FILE
+        self.weeks: dict[int, dict] = {}
+        self._legacy: list[Path] = []
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    # ---------- carga / volcado ----------
+    @classmethod
+    def for_dir(cls, meta_dir: Path) -> "MetaStore":
+        """Store compartido del directorio: se lee de disco una sola vez por proceso."""
+        key = Path(meta_dir).resolve()
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls._instances[key] = cls.load(Path(meta_dir))
+            return store
+
+    @classmethod
+    def clear_cache(cls):
+        """Olvida los stores cargados (el siguiente for_dir vuelve a leer de disco)."""
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    @classmethod
+    def load(cls, meta_dir: Path) -> "MetaStore":
+        store = cls(meta_dir)
+        for path in (store.path, store.checks_path):
+            if not path.exists():
+                continue
+            try:
+                raw = json.loads(path.read_text(encoding="utf-8"))
+                for w, v in raw.get("weeks", {}).items():
+                    store.weeks.setdefault(int(w), {}).update(v)
+            except Exception:
+                continue
+        store._migrate_legacy()
+        return store
+
+    def _migrate_legacy(self):
+        """Importa (una vez) los antiguos week_{n}.lastmod / week_{n}.etag."""
+        if not self.meta_dir.exists():
+            return
+        for p in sorted(self.meta_dir.glob("week_*.*")):
+            kind = _LEGACY_KINDS.get(p.suffix.lstrip("."))
+            if kind is None:
+                continue
+            try:
+                week = int(p.stem.split("_", 1)[1])
+            except ValueError:
+                continue
+            value = p.read_text(encoding="utf-8").strip()
+            entry = self.weeks.setdefault(week, {})
+            if value and kind not in entry:
+                entry[kind] = value
+            self._legacy.append(p)
+        if self._legacy:
+            self._dirty = True
+
+    def _payload(self, volatile: bool) -> dict:
+        weeks = {}
+        for w in sorted(self.weeks):
+            entry = {k: v for k, v in sorted(self.weeks[w].items()) if (k in VOLATILE_FIELDS) == volatile}
+            if entry:
+                weeks[str(w)] = entry
+        return {"weeks": weeks}
+
+    def flush(self):
+        """Escribe index.json / checks.json si cambiaron y borra los ficheros antiguos migrados."""
+        with self._lock:
+            if not self._dirty:
+                return
+            files = {self.path: self._payload(False), self.checks_path: self._payload(True)}
+            self._dirty = False
+            legacy, self._legacy = self._legacy, []
+        self.meta_dir.mkdir(parents=True, exist_ok=True)
+        for path, payload in files.items():
+            text = json.dumps(payload, ensure_ascii=False, indent=1)
+            if not path.exists() or path.read_text(encoding="utf-8") != text:
+                write_atomic(path, text)
+        for p in legacy:
+            p.unlink(missing_ok=True)
+
+    # ---------- acceso ----------
+    def get(self, week: int) -> dict:
+        with self._lock:
+            return dict(self.weeks.get(week, {}))
+
+    def validators(self, week: int) -> tuple[str | None, str | None]:
+        """(ETag, Last-Modified) guardados para la semana."""
+        entry = self.get(week)
+        return entry.get("etag"), entry.get("lastmod")
+
+    def update(self, week: int, **fields):
+        """Actualiza campos de la semana. Un valor None borra el campo."""
+        with self._lock:
+            entry = self.weeks.setdefault(week, {})
+            for key, value in fields.items():
+                if key not in WEEK_FIELDS:
+                    raise KeyError(f"Campo de meta desconocido: {key}")
+                if value is None:
+                    if key in entry:
+                        del entry[key]
+                        self._dirty = True
+                elif entry.get(key) != value:
+                    entry[key] = value
+                    self._dirty = True
+
+
+def content_hash(data) -> str:
+    """sha256 del JSON con claves ordenadas (independiente del formato de la respuesta)."""
+    raw = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def summarize_week(matches, is_finished, kickoff_of) -> dict:
+    """Resumen de estado de la semana: nº de partidos, terminados y próximo kickoff pendiente."""
+    pending = [kickoff_of(m) for m in matches if not is_finished(m)]
+    pending = [k for k in pending if k is not None]
+    return {
+        "matches": len(matches),
+        "finished": sum(1 for m in matches if is_finished(m)),
+        "next_kickoff": min(pending).astimezone(timezone.utc).isoformat() if pending else None,
+    }
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
@@ -0,0 +1,93 @@
+"""
+Métricas por ejecución: tiempos por fase, respuestas HTTP, bytes y semanas.
+
+Cada liga tiene su RunMetrics (una liga = un proceso en run.py, pero el registro
+también sirve con varias ligas en el mismo proceso, p. ej. en bench/). Las fases
+pueden anidarse: "merge" incluye "extract" y parte de "write".
+
+    with metrics.for_league(cfg.slug).phase("fetch"):
+        ...
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+
+class RunMetrics:
+    def __init__(self, league: str):
+        self.league = league
+        self.phases: dict[str, dict] = {}
+        self.http: dict[str, int] = {}
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.files_written = 0
+        self.weeks: dict[str, int] = {"planned": 0, "changed": 0, "unchanged": 0, "failed": 0}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - t0)
+
+    def add_time(self, name: str, seconds: float):
+        with self._lock:
+            p = self.phases.setdefault(name, {"count": 0, "total_s": 0.0, "max_s": 0.0})
+            p["count"] += 1
+            p["total_s"] += seconds
+            p["max_s"] = max(p["max_s"], seconds)
+
+    def record_http(self, status: int | str, nbytes: int = 0, retries: int = 0):
+        with self._lock:
+            key = str(status)
+            self.http[key] = self.http.get(key, 0) + 1
+            self.bytes_in += nbytes
+            self.retries += retries
+
+    def record_write(self, nbytes: int, files: int = 1):
+        with self._lock:
+            self.bytes_out += nbytes
+            self.files_written += files
+
+    def count_week(self, outcome: str, n: int = 1):
+        with self._lock:
+            self.weeks[outcome] = self.weeks.get(outcome, 0) + n
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "league": self.league,
+                "phases": {
+                    k: {"count": v["count"], "total_s": round(v["total_s"], 4), "max_s": round(v["max_s"], 4)}
+                    for k, v in sorted(self.phases.items())
+                },
+                "http": dict(sorted(self.http.items())),
+                "retries": self.retries,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "files_written": self.files_written,
+                "weeks": dict(self.weeks),
+            }
+
+
+_REGISTRY: dict[str, RunMetrics] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def for_league(league: str) -> RunMetrics:
+    with _REGISTRY_LOCK:
+        m = _REGISTRY.get(league)
+        if m is None:
+            m = _REGISTRY[league] = RunMetrics(league)
+        return m
+
+
+def reset(league: str | None = None):
+    with _REGISTRY_LOCK:
+        if league is None:
+            _REGISTRY.clear()
+        else:
+            _REGISTRY.pop(league, None)
@@ -0,0 +1,130 @@
+"""
+Normalización de campos de partido (nombres de equipo y fecha/hora).
+
+Los mismos ~20 nombres y ~10 horarios se repiten en todas las jornadas de una
+temporada, así que cada función pura va memoizada con una caché acotada y los
+patrones se compilan una sola vez. Los adaptadores de leagues.py delegan aquí.
+"""
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+# =========================
+# CONFIG
+# =========================
+TZ_MADRID = ZoneInfo("Europe/Madrid")
+TZ_LONDON = ZoneInfo("Europe/London")
+WEEKDAY_ABBR_ES = ["Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom"]
+
+# Tamaño de las cachés: sobra para varias temporadas de todas las ligas.
+CACHE_SIZE = 4096
+
+_MULTISPACE = re.compile(r"\s{2,}")
+_SAD = re.compile(r"\s*SAD\s*", re.IGNORECASE)
+_CLUB_DE_FUTBOL = re.compile(r"Club de Fútbol", re.IGNORECASE)
+_FUTBOL_CLUB = re.compile(r"Fútbol Club", re.IGNORECASE)
+
+NO_TIME = "--:--"
+
+
+# =========================
+# EQUIPOS
+# =========================
+@lru_cache(maxsize=CACHE_SIZE)
+def collapse_spaces(name: str) -> str:
+    if not name:
+        return ""
+    return _MULTISPACE.sub(" ", name).strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_team_name_es(name: str) -> str:
+    """Nombre de club español sin 'SAD' y con 'CF'/'FC' abreviados."""
+    if not name:
+        return ""
+    name = _SAD.sub(" ", name)
+    name = _CLUB_DE_FUTBOL.sub("CF", name)
+    name = _FUTBOL_CLUB.sub("FC", name)
+    return collapse_spaces(name)
+
+
+# =========================
+# FECHAS
+# =========================
+def _fecha(dt_local: datetime) -> str:
+    return f"{WEEKDAY_ABBR_ES[dt_local.weekday()]} {dt_local:%d-%m-%Y}"
+
+
+def _fallback(raw: str) -> tuple[str, str]:
+    return (raw.split("T", 1)[0] if "T" in raw else raw, NO_TIME)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_utc_iso(iso_str: str) -> datetime | None:
+    """'2025-08-15T19:00:00Z' -> datetime aware en UTC (None si no se entiende)."""
+    if not iso_str:
+        return None
+    try:
+        return datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_london(raw: str) -> datetime | None:
+    """'2025-08-15 20:00:00' (hora de Londres) -> datetime aware."""
+    if not raw:
+        return None
+    try:
+        return datetime.strptime(raw, "%Y-%m-%d %H:%M:%S").replace(tzinfo=TZ_LONDON)
+    except ValueError:
+        return None
+
+
+def is_time_placeholder(dt_utc: datetime) -> bool:
+    """Algunas APIs ponen 00:00 UTC cuando aún no hay horario definitivo."""
+    dt_utc = dt_utc.astimezone(timezone.utc)
+    return dt_utc.hour == 0 and dt_utc.minute == 0 and dt_utc.second == 0
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fecha_y_hora_utc_iso(iso_str: str) -> tuple[str, str]:
+    """(Fecha, Horario) en hora de Madrid para un kickoff ISO en UTC."""
+    if not iso_str:
+        return ("", NO_TIME)
+    dt_utc = parse_utc_iso(iso_str)
+    if dt_utc is None:
+        return _fallback(iso_str)
+    dt_local = dt_utc.astimezone(TZ_MADRID)
+    if is_time_placeholder(dt_utc):
+        return (_fecha(dt_local), NO_TIME)
+    return (_fecha(dt_local), f"{dt_local:%H:%M}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fecha_y_hora_london(raw: str) -> tuple[str, str]:
+    """(Fecha, Horario) en hora de Madrid para un kickoff local de Londres."""
+    if not raw:
+        return ("", NO_TIME)
+    dt_london = parse_london(raw)
+    if dt_london is None:
+        return _fallback(raw)
+    dt_local = dt_london.astimezone(TZ_MADRID)
+    return (_fecha(dt_local), f"{dt_local:%H:%M}")
+
+
+# =========================
+# CACHÉS
+# =========================
+_CACHED = (collapse_spaces, clean_team_name_es, parse_utc_iso, parse_london, fecha_y_hora_utc_iso, fecha_y_hora_london)
+
+
+def cache_info() -> dict[str, dict]:
+    """Aciertos/fallos de cada caché (para el informe y los benchmarks)."""
+    return {fn.__name__: fn.cache_info()._asdict() for fn in _CACHED}
+
+
+def clear_caches():
+    for fn in _CACHED:
+        fn.cache_clear()
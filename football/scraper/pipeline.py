@@ -0,0 +1,637 @@
+"""
+Secuencia común a todas las ligas: detección de jornada, descarga de semanas,
+guardado y merge en matches_<liga>.json. Todo lo específico del proveedor vive
+en cfg.adapter (ver scraper/leagues.py).
+"""
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+from scraper import canonical, metrics
+from scraper.checkpoint import BREAKER_REASON, RunCheckpoint
+from scraper.changes import append_changes, diff_weeks
+from scraper.compact import COMPACT_ENABLED, compact_path, write_compact
+from scraper.concurrency import DEFAULT_WORKERS, map_concurrently, run_stages
+from scraper.http_client import get_json, is_outage
+from scraper.ics import ICS_DIR, write_ics_feeds
+from scraper.leagues import TZ_MADRID, LeagueConfig
+from scraper.meta_store import MetaStore, content_hash, summarize_week, utc_now_iso
+from scraper.refresh import build_refresh_plan
+from scraper.schedule import ScheduleIndex
+from scraper.shards import SHARDS_DIR, load_manifest, write_shards
+from scraper.standings import StandingsTable, standings_path
+from scraper.store import STORE_PATH, infer_season, open_store
+from scraper.teams import DIRECTORY_FILE, TEAMS_DIR, write_team_index
+
+# =========================
+# CONFIG
+# =========================
+BULK_MIN_WEEKS = int(os.environ.get("SCRAPER_BULK_MIN_WEEKS", "8"))  # jornadas a partir de las que se pide la temporada
+BULK_TTL = 60                                                        # segundos que se reutiliza la respuesta de temporada
+RETRY_DELAY = float(os.environ.get("SCRAPER_RETRY_DELAY", "20"))     # espera antes de reintentar las fallidas (<0 = sin reintento)
+
+
+# =========================
+# META (ETag / Last-Modified / estado) por liga
+# =========================
+def _meta(cfg: LeagueConfig) -> MetaStore:
+    # Un único meta/index.json por liga, cargado una vez y volcado al final de process_league
+    return MetaStore.for_dir(cfg.meta_dir)
+
+def _metrics(cfg: LeagueConfig) -> metrics.RunMetrics:
+    return metrics.for_league(cfg.slug)
+
+
+# =========================
+# SALIDAS LOCALES
+# =========================
+def _outputs_exist(cfg: LeagueConfig, week: int) -> bool:
+    return (cfg.out_dir_json / f"matches_week_{week}.json").exists()
+
+
+class ApiError(RuntimeError):
+    """Error de descarga sin la URL. outage: la API no responde (red, timeout, 429, 5xx), no un 4xx."""
+
+    def __init__(self, message: str, outage: bool):
+        super().__init__(message)
+        self.outage = outage
+
+def _is_outage(e: BaseException) -> bool:
+    return isinstance(e, ApiError) and e.outage
+
+def _get(cfg: LeagueConfig, url: str, params: dict | None, etag: str | None, lastmod: str | None, what: str):
+    m = _metrics(cfg)
+    t0 = time.perf_counter()
+    try:
+        result = get_json(url, params=params, etag=etag, last_modified=lastmod)
+    except requests.RequestException as e:
+        m.add_time("fetch", time.perf_counter() - t0)
+        m.record_http("error")
+        # Sin el mensaje original: la URL puede llevar la subscription-key.
+        status = getattr(e.response, "status_code", None)
+        detail = f"{type(e).__name__} {status}" if status else type(e).__name__
+        raise ApiError(f"[{cfg.name}] Error al descargar datos de la API para {what}: {detail}", is_outage(e)) from None
+    m.add_time("fetch", time.perf_counter() - t0 - result.decode_s)
+    m.add_time("decode", result.decode_s)
+    m.record_http(result.status, result.nbytes, retries=result.attempts - 1)
+    return result
+
+# =========================
+# FETCH SEMANA por liga
+# =========================
+@dataclass
+class FetchedWeek:
+    """
+    Respuesta 200 de una semana. Sus validadores no pasan a meta hasta que el
+    fichero de la semana está escrito: si el proceso muere antes, la siguiente
+    ejecución no recibe un 304 para un fichero que nunca se actualizó.
+    """
+    data: dict
+    etag: str | None = None
+    lastmod: str | None = None
+    checked_at: str = field(default_factory=utc_now_iso)
+
+def fetch_week(cfg: LeagueConfig, week: int, use_cache: bool = True) -> FetchedWeek | None:
+    """GET (condicional con use_cache) de la semana; None si no ha cambiado (304). No toca meta."""
+    if not cfg.base_week_url:
+        raise RuntimeError(f"[{cfg.name}] Falta {cfg.url_env or 'BASE_WEEK_URL'}.")
+
+    url, params = cfg.adapter.week_request(cfg.base_week_url, week)
+    etag, lastmod = _meta(cfg).validators(week) if use_cache else (None, None)
+    result = _get(cfg, url, params, etag, lastmod, f"la semana {week}")
+
+    if result.not_modified:
+        print(f"🔄 [{cfg.name}] Semana {week}: sin cambios (304).")
+        return None
+    return FetchedWeek(result.data, result.etag, result.last_modified)
+
+def fetch_week_json(cfg: LeagueConfig, week: int, use_cache: bool = True):
+    fetched = fetch_week(cfg, week, use_cache)
+    return fetched.data if fetched else None
+
+
+# =========================
+# FETCH TEMPORADA (opcional: cfg.bulk_url)
+# =========================
+_bulk_cache: dict[str, tuple[float, dict[int, dict]]] = {}
+_bulk_lock = threading.Lock()
+
+def use_bulk(cfg: LeagueConfig, weeks) -> bool:
+    """Una petición de temporada compensa cuando hay que pedir muchas jornadas."""
+    return bool(cfg.bulk_url) and len(weeks) >= BULK_MIN_WEEKS
+
+def fetch_season_json(cfg: LeagueConfig) -> dict[int, dict]:
+    """
+    Toda la temporada en una petición, repartida por jornada: semana -> payload
+    con la misma forma que la respuesta de esa semana. La respuesta se reutiliza
+    durante BULK_TTL segundos (detección + descarga de la misma ejecución).
+    """
+    with _bulk_lock:
+        hit = _bulk_cache.get(cfg.slug)
+        if hit and time.monotonic() - hit[0] < BULK_TTL:
+            return hit[1]
+        adapter = cfg.adapter
+        url, params = adapter.season_request(cfg.bulk_url)
+        result = _get(cfg, url, params, None, None, "la temporada")
+        by_week: dict[int, list] = {}
+        for match in adapter.parse_matches(result.data):
+            week = adapter.match_week(match)
+            if week is None:
+                raise RuntimeError(f"[{cfg.name}] La respuesta de temporada no indica la jornada de cada partido.")
+            by_week.setdefault(week, []).append(match)
+        payloads = {w: {adapter.payload_key: ms} for w, ms in sorted(by_week.items())}
+        _bulk_cache[cfg.slug] = (time.monotonic(), payloads)
+        print(f"📦 [{cfg.name}] Temporada completa en una petición: {len(payloads)} jornadas.")
+        return payloads
+
+def _season_payloads(cfg: LeagueConfig, weeks, run: RunCheckpoint | None = None) -> dict[int, dict]:
+    """Payloads de temporada si compensa y la API responde; si no, {} (se pide semana a semana)."""
+    if not use_bulk(cfg, weeks) or (run is not None and not run.allow()):
+        return {}
+    try:
+        payloads = fetch_season_json(cfg)
+    except Exception as e:
+        print(f"⚠️  [{cfg.name}] Sin descarga de temporada ({e}); se pide semana a semana.")
+        if run is not None:
+            run.failed_request(_is_outage(e))
+        return {}
+    if run is not None:
+        run.succeeded()
+    return payloads
+
+
+# =========================
+# DETECCIÓN DE JORNADA por liga
+# =========================
+def detect_current_week(cfg: LeagueConfig, schedule: ScheduleIndex, now_madrid: datetime,
+                        max_workers: int = DEFAULT_WORKERS, run: RunCheckpoint | None = None,
+                        fetched: dict[int, FetchedWeek] | None = None) -> int:
+    """
+    Jornada actual a partir del índice de calendario (meta/schedule.json).
+    El índice se completa con los ficheros de semana ya guardados; solo se va a
+    la red si faltan jornadas o el índice ha caducado. Las semanas que no se
+    pudieron leer quedan en run.detect_failed (la jornada puede no ser la buena).
+    Las respuestas descargadas se dejan en `fetched` para no pedirlas otra vez.
+    """
+    adapter = cfg.adapter
+    schedule.rebuild_from_files(cfg.out_dir_json, cfg.season_weeks, adapter.parse_matches, adapter.match_kickoff)
+    if schedule.built_at is None and not schedule.missing(cfg.season_weeks):
+        schedule.mark_built(now_madrid)
+
+    full = schedule.is_stale(now_madrid)
+    to_refresh = list(range(1, cfg.season_weeks + 1)) if full else schedule.missing(cfg.season_weeks)
+    failed: list[int] = []
+    if to_refresh:
+        print(f"📅 [{cfg.name}] Actualizando calendario por red: semanas {to_refresh}")
+        failed = refresh_schedule(cfg, schedule, to_refresh, max_workers, run, fetched)
+        if full:
+            # Las que fallan no invalidan el resto: solo ellas se vuelven a pedir (missing())
+            schedule.forget(failed)
+            schedule.rebuild_from_files(cfg.out_dir_json, cfg.season_weeks, adapter.parse_matches, adapter.match_kickoff)
+            schedule.mark_built(now_madrid)
+        if failed:
+            print(f"⚠️  [{cfg.name}] Calendario incompleto (semanas {failed}): la jornada detectada puede no ser la correcta.")
+    if run is not None:
+        # También sin nada que pedir: los fallos de una ejecución anterior ya no cuentan
+        run.detect_failed = failed
+
+    week = schedule.current_week(now_madrid)
+    return week if week else 1
+
+def refresh_schedule(cfg: LeagueConfig, schedule: ScheduleIndex, weeks: list[int], max_workers: int,
+                     run: RunCheckpoint | None = None, fetched: dict[int, FetchedWeek] | None = None) -> list[int]:
+    """
+    Descarga las semanas indicadas para el índice (las vacías quedan marcadas
+    como tales). Con `fetched`, guarda ahí cada respuesta para que process_weeks
+    la reutilice. Devuelve las que fallaron.
+    """
+    adapter = cfg.adapter
+    fetched = {} if fetched is None else fetched
+
+    def _index(week: int, response: FetchedWeek):
+        schedule.update_week(week, [adapter.match_kickoff(m) for m in adapter.parse_matches(response.data)])
+        fetched[week] = response
+
+    bulk = _season_payloads(cfg, weeks, run)
+    for week in weeks:
+        if week in bulk:
+            _index(week, FetchedWeek(bulk[week]))
+    weeks = [w for w in weeks if w not in bulk]
+
+    def _refresh(week: int) -> bool:
+        if run is not None and not run.allow():
+            return False
+        try:
+            response = fetch_week(cfg, week, use_cache=False)
+        except Exception as e:
+            print(f"⚠️  [{cfg.name}] Semana {week}: no se pudo leer el calendario: {e}")
+            if run is not None:
+                run.failed_request(_is_outage(e))
+            return False
+        if run is not None:
+            run.succeeded()
+        if response is not None:
+            _index(week, response)
+        return True
+
+    ok = map_concurrently(_refresh, weeks, max_workers)
+    return [w for w, good in zip(weeks, ok) if not good]
+
+
+# =========================
+# I/O por liga
+# =========================
+def save_json(cfg: LeagueConfig, data: dict, week: int):
+    cfg.out_dir_json.mkdir(parents=True, exist_ok=True)
+    path = cfg.out_dir_json / f"matches_week_{week}.json"
+    with _metrics(cfg).phase("write"):
+        canonical.write_atomic(path, canonical.dumps(data, indent=2))
+    _metrics(cfg).record_write(path.stat().st_size)
+    return path
+
+def week_rows(cfg: LeagueConfig, matches, week: int) -> list[dict]:
+    with _metrics(cfg).phase("extract"):
+        return cfg.adapter.extract_rows(matches, week)
+
+def _load_week_files(cfg: LeagueConfig) -> dict[int, list]:
+    weeks = {}
+    for week in range(1, cfg.season_weeks + 1):
+        week_path = cfg.out_dir_json / f"matches_week_{week}.json"
+        if week_path.exists():
+            with open(week_path, "r", encoding="utf-8") as f:
+                weeks[week] = cfg.adapter.parse_matches(json.load(f))
+    return weeks
+
+def update_main_json(cfg: LeagueConfig, main_json_path: Path, changed: dict[int, list],
+                     current: dict[str, list[dict]] | None = None,
+                     rows: dict[int, list[dict]] | None = None) -> dict[str, list[dict]]:
+    """
+    Aplica a main_json_path solo las jornadas que han cambiado en esta ejecución
+    (changed: semana -> partidos). Si el archivo aún no existe, se construye a
+    partir de todos los matches_week_{n}.json guardados.
+    Solo sobrescribe si hay cambios, y entonces añade las diferencias por
+    partido a changes.jsonl. Devuelve el contenido resultante.
+    current = contenido ya cargado en memoria (modo --watch), para no releerlo.
+    rows = filas ya extraídas por la etapa de parseo (semana -> filas).
+    """
+    with _metrics(cfg).phase("merge"):
+        return _update_main_json(cfg, main_json_path, changed, current, rows or {})
+
+def _update_main_json(cfg: LeagueConfig, main_json_path: Path, changed: dict[int, list],
+                      current: dict[str, list[dict]] | None, rows: dict[int, list[dict]]) -> dict[str, list[dict]]:
+    if current is None and main_json_path.exists():
+        current = _load_main_json(main_json_path)
+    first_build = current is None
+    if current is None:
+        current = {}
+        changed = {**_load_week_files(cfg), **changed}
+
+    all_weeks = dict(current)
+    for week, matches in sorted(changed.items()):
+        all_weeks[str(week)] = rows[week] if week in rows else week_rows(cfg, matches, week)
+    all_weeks = canonical.sort_weeks(all_weeks)
+
+    if current == all_weeks:
+        print(f"🟢 Sin cambios en {main_json_path.name}, no se sobrescribe.")
+        return all_weeks
+    main_json_path.parent.mkdir(parents=True, exist_ok=True)
+    with _metrics(cfg).phase("write"):
+        canonical.write_atomic(main_json_path, canonical.dumps(all_weeks, indent=2, sort_keys=False))
+    _metrics(cfg).record_write(main_json_path.stat().st_size)
+    print(f"🟡 {main_json_path.name} actualizado ({len(changed)} jornadas).")
+
+    # En la primera construcción no hay versión anterior con la que comparar
+    if not first_build:
+        logged = append_changes(main_json_path.parent, cfg.slug, diff_weeks(current, all_weeks, changed))
+        if logged:
+            print(f"📰 [{cfg.name}] {logged} cambios añadidos a changes.jsonl.")
+    return all_weeks
+
+def _load_main_json(main_json_path: Path) -> dict[str, list[dict]]:
+    with open(main_json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _derived_outputs_missing(cfg: LeagueConfig) -> bool:
+    return (
+        load_manifest(cfg.league_dir) is None
+        or not standings_path(cfg.league_dir, cfg.slug).exists()
+        or not (cfg.league_dir / TEAMS_DIR / DIRECTORY_FILE).exists()
+        or not (cfg.league_dir / ICS_DIR / f"{cfg.slug}.ics").exists()
+        or (COMPACT_ENABLED and not compact_path(cfg.league_dir, cfg.slug).exists())
+    )
+
+def write_derived_outputs(cfg: LeagueConfig, all_weeks: dict[str, list[dict]], changed: set[int] | None = None):
+    """
+    Salidas generadas a partir de matches_<liga>.json: shards + manifest para la
+    web, clasificación, índice por equipo, calendarios .ics, versión compacta y,
+    si está configurado, el almacén SQLite. changed = jornadas que han cambiado
+    (None = todas).
+    """
+    m = _metrics(cfg)
+    with m.phase("derived"):
+        written = write_shards(cfg.league_dir, all_weeks)
+    if written:
+        m.record_write(sum((cfg.league_dir / SHARDS_DIR / f"week_{w}.json").stat().st_size for w in written), len(written))
+        print(f"🧩 [{cfg.name}] Shards actualizados: jornadas {written}")
+
+    with m.phase("derived"):
+        table = StandingsTable.load(cfg.meta_dir)
+        recalculated = table.sync(all_weeks, changed)
+        table.save()
+        path = standings_path(cfg.league_dir, cfg.slug)
+        wrote = table.write_output(path, cfg.slug)
+    if wrote:
+        m.record_write(path.stat().st_size)
+        print(f"🏆 [{cfg.name}] Clasificación actualizada ({len(recalculated)} jornadas recalculadas).")
+
+    with m.phase("derived"):
+        teams = write_team_index(cfg.league_dir, all_weeks, changed)
+    if teams:
+        m.record_write(sum((cfg.league_dir / TEAMS_DIR / f"{t}.json").stat().st_size for t in teams), len(teams))
+        print(f"👕 [{cfg.name}] Índice por equipo actualizado: {len(teams)} equipos.")
+
+    with m.phase("derived"):
+        feeds = write_ics_feeds(cfg.league_dir, cfg.slug, cfg.name, all_weeks, changed)
+    if feeds:
+        m.record_write(sum((cfg.league_dir / ICS_DIR / f"{f}.ics").stat().st_size for f in feeds), len(feeds))
+        print(f"📆 [{cfg.name}] Calendarios .ics actualizados: {len(feeds)}.")
+
+    if COMPACT_ENABLED:
+        with m.phase("derived"):
+            compact = write_compact(cfg.league_dir, cfg.slug, all_weeks)
+        if compact:
+            m.record_write(sum(p.stat().st_size for p in compact), len(compact))
+            sizes = ", ".join(f"{p.name.rsplit('.', 1)[-1]} {p.stat().st_size // 1024} KB" for p in compact)
+            print(f"🗜️ [{cfg.name}] Versión compacta actualizada ({sizes}).")
+
+    if STORE_PATH:
+        season = infer_season(all_weeks)
+        if season is not None:
+            with m.phase("derived"), open_store() as store:
+                weeks = changed if store.has_season(cfg.slug, season) else None
+                rows = store.upsert_weeks(cfg.slug, season, all_weeks, weeks)
+            if rows:
+                print(f"🗄️ [{cfg.name}] Almacén actualizado: {rows} filas (temporada {season}).")
+
+def _ensure_week_state(cfg: LeagueConfig, week: int):
+    """Tras un 304 (o un 200 idéntico), calcula el estado desde el fichero local si meta aún no lo tiene."""
+    if _meta(cfg).get(week).get("state"):
+        return
+    adapter = cfg.adapter
+    try:
+        with open(cfg.out_dir_json / f"matches_week_{week}.json", "r", encoding="utf-8") as f:
+            matches = adapter.parse_matches(json.load(f))
+    except Exception:
+        return
+    _meta(cfg).update(week, state=summarize_week(matches, adapter.match_finished, adapter.match_kickoff))
+
+@dataclass
+class WeekUpdate:
+    """Semana que ha cambiado, tal como sale de la etapa de parseo."""
+    week: int
+    data: dict          # payload canónico
+    matches: list
+    rows: list[dict]
+    digest: str
+    etag: str | None = None       # validadores de la respuesta: se guardan al escribir
+    lastmod: str | None = None
+    checked_at: str = field(default_factory=utc_now_iso)
+
+def fetch_week_stage(cfg: LeagueConfig, week: int, run: RunCheckpoint | None = None,
+                     use_cache: bool = True) -> FetchedWeek | None:
+    """
+    Etapa de red: respuesta de la semana, o None si no ha cambiado (304) o ha
+    fallado. Con run, los fallos (y su motivo) quedan en el checkpoint y, si el
+    circuito está abierto, ni siquiera se hace la petición.
+    """
+    m = _metrics(cfg)
+
+    def _failed(e: Exception, attempted: bool = True) -> None:
+        m.count_week("failed")
+        if run is not None:
+            run.failed_week(week, str(e), attempted=attempted, outage=_is_outage(e))
+
+    if run is not None and not run.allow():
+        print(f"⏭️ [{cfg.name}] Semana {week}: omitida ({BREAKER_REASON}).")
+        return _failed(RuntimeError(BREAKER_REASON), attempted=False)
+    try:
+        fetched = fetch_week(cfg, week, use_cache=use_cache)
+    except Exception as e:
+        print(f"❌ [{cfg.name}] Semana {week}: error al descargar: {e}")
+        return _failed(e)
+
+    if fetched is None:
+        if not _outputs_exist(cfg, week):
+            print(f"⚠️  [{cfg.name}] Semana {week}: 304 pero faltan archivos locales; forzando descarga completa...")
+            try:
+                fetched = fetch_week(cfg, week, use_cache=False)
+            except Exception as e:
+                print(f"❌ [{cfg.name}] Semana {week}: error al forzar descarga: {e}")
+                return _failed(e)
+        else:
+            # 304 con el fichero en disco: describe justo lo que hay guardado
+            _meta(cfg).update(week, checked_at=utc_now_iso())
+            _ensure_week_state(cfg, week)
+            m.count_week("unchanged")
+    if run is not None:
+        # La semana queda hecha ya si no cambia; si no, al escribirla
+        run.succeeded(week if fetched is None else None)
+    return fetched
+
+def parse_week_stage(cfg: LeagueConfig, week: int, fetched: FetchedWeek) -> WeekUpdate | None:
+    """Etapa de CPU: forma canónica, hash y filas. None si el contenido no ha cambiado."""
+    adapter = cfg.adapter
+    # Forma canónica: es lo que se guarda y lo que se compara con el hash anterior
+    data = adapter.canonical_payload(fetched.data)
+    digest = content_hash(data)
+    if digest == _meta(cfg).get(week).get("hash") and _outputs_exist(cfg, week):
+        # 200 con el mismo contenido (la API de la Premier nunca da 304): nada que escribir ni
+        # fusionar, y los validadores nuevos ya describen el fichero guardado
+        print(f"🟰 [{cfg.name}] Semana {week}: sin cambios (mismo hash).")
+        _meta(cfg).update(week, etag=fetched.etag, lastmod=fetched.lastmod, checked_at=fetched.checked_at)
+        _ensure_week_state(cfg, week)
+        _metrics(cfg).count_week("unchanged")
+        return None
+    matches = adapter.parse_matches(data)
+    return WeekUpdate(week, data, matches, week_rows(cfg, matches, week), digest,
+                      fetched.etag, fetched.lastmod, fetched.checked_at)
+
+def write_week_stage(cfg: LeagueConfig, updates: list[WeekUpdate], schedule: ScheduleIndex | None = None):
+    """
+    Etapa de escritura (un solo hilo): ficheros de semana con escritura atómica y,
+    después, metadatos del lote, validadores incluidos. Si el proceso muere a
+    mitad, meta no describe ningún fichero sin escribir y esas semanas se vuelven
+    a pedir con un GET completo.
+    """
+    adapter = cfg.adapter
+    for u in updates:
+        p_json = save_json(cfg, u.data, u.week)
+        if schedule is not None:
+            schedule.update_week(u.week, [adapter.match_kickoff(m) for m in u.matches])
+        _meta(cfg).update(
+            u.week,
+            etag=u.etag,
+            lastmod=u.lastmod,
+            hash=u.digest,
+            fetched_at=utc_now_iso(),
+            checked_at=u.checked_at,
+            state=summarize_week(u.matches, adapter.match_finished, adapter.match_kickoff),
+        )
+        print(f"✅ [{cfg.name}] Semana {u.week} guardada/actualizada: {p_json}")
+        _metrics(cfg).count_week("changed")
+    _meta(cfg).flush()
+
+def process_weeks(cfg: LeagueConfig, weeks: list[int], schedule: ScheduleIndex | None = None,
+                  max_workers: int = DEFAULT_WORKERS, run: RunCheckpoint | None = None,
+                  prefetched: dict[int, FetchedWeek] | None = None,
+                  unconditional=()) -> dict[int, WeekUpdate]:
+    """
+    Descarga, parsea y guarda las semanas en etapas (ver concurrency.run_stages):
+    las descargas van en paralelo (el ritmo lo marca el limitador por host), el
+    parseo y la escritura por lotes solapan con ellas. Si la liga tiene bulk_url
+    y son muchas jornadas, se pide la temporada entera una vez y se reparte.
+    Con run, cada jornada hecha o fallida queda en el checkpoint. prefetched =
+    respuestas ya descargadas en esta ejecución (detección de jornada), que no
+    se vuelven a pedir; unconditional = semanas que se piden sin GET
+    condicional. Devuelve las que han cambiado.
+    """
+    updates: dict[int, WeekUpdate] = {}
+    prefetched = prefetched or {}
+    # Con bulk_url y muchas jornadas, una sola petición; las que no vengan en ella, semana a semana
+    bulk = _season_payloads(cfg, [w for w in weeks if w not in prefetched], run)
+
+    def _fetch(week: int) -> FetchedWeek | None:
+        if week in prefetched:
+            return prefetched[week]
+        if week in bulk:
+            # Sin validadores: el ETag de la semana no describe el payload de temporada
+            return FetchedWeek(bulk[week])
+        return fetch_week_stage(cfg, week, run, use_cache=week not in unconditional)
+
+    def _parse(week: int, fetched: FetchedWeek) -> WeekUpdate | None:
+        update = parse_week_stage(cfg, week, fetched)
+        if update is None and run is not None:
+            run.succeeded(week)
+        return update
+
+    def _write(batch: list[tuple[int, WeekUpdate]]):
+        write_week_stage(cfg, [u for _, u in batch], schedule)
+        updates.update(batch)
+        if run is not None:
+            for week, _ in batch:
+                run.succeeded(week)
+            run.save()
+
+    run_stages(weeks, _fetch, _parse, _write, max_workers)
+    return dict(sorted(updates.items()))
+
+
+def retry_failed(cfg: LeagueConfig, run: RunCheckpoint, schedule: ScheduleIndex,
+                 max_workers: int = DEFAULT_WORKERS) -> dict[int, WeekUpdate]:
+    """Un reintento corto de las semanas fallidas, salvo que el circuito esté abierto."""
+    failed = sorted(run.failed)
+    if not failed or RETRY_DELAY < 0:
+        return {}
+    if not run.allow():
+        print(f"🚫 [{cfg.name}] {BREAKER_REASON}; sin reintento (semanas {failed}).")
+        return {}
+    print(f"🔁 [{cfg.name}] Reintentando semanas {failed} en {RETRY_DELAY:g} s...")
+    time.sleep(RETRY_DELAY)
+    m = _metrics(cfg)
+    m.count_week("failed", -len(failed))   # se vuelven a contar según el resultado del reintento
+    m.count_week("retried", len(failed))
+    return process_weeks(cfg, failed, schedule, max_workers, run)
+
+
+# =========================
+# SECUENCIA COMPLETA POR LIGA
+# =========================
+def week_window(current: int, last: int) -> list[int]:
+    """Jornada anterior, actual y las 4 siguientes."""
+    weeks = []
+    if current > 1:
+        weeks.append(current - 1)
+    weeks.append(current)
+    for i in range(1, 5):  # 4 siguientes
+        if current + i <= last:
+            weeks.append(current + i)
+    return weeks
+
+def process_league(cfg: LeagueConfig, forced_week: int | None, max_workers: int = DEFAULT_WORKERS,
+                   force: bool = False, resume: bool = False):
+    """
+    Sin --week/--force las semanas a pedir salen del plan de refresco (scraper/refresh.py):
+    las finalizadas no se vuelven a pedir y las lejanas solo de vez en cuando.
+    Con --week se fuerza la ventana (prev, actual, +4) alrededor de esa jornada.
+    Con resume solo se repite lo que la ejecución anterior dejó pendiente
+    (meta/run.json). Las semanas que fallan se reintentan una vez al final.
+    """
+    m = _metrics(cfg)
+    now_madrid = datetime.now(TZ_MADRID)
+    schedule = ScheduleIndex.load(cfg.meta_dir)
+
+    fetched: dict[int, FetchedWeek] = {}   # respuestas de la detección, reutilizadas en la descarga
+    run = RunCheckpoint.load(cfg.meta_dir) if resume else None
+    if resume:
+        if run is None or run.complete:
+            print(f"✅ [{cfg.name}] Nada que reanudar: la última ejecución terminó completa.")
+            return
+        print(f"⏯️ [{cfg.name}] Reanudando la ejecución del {run.started}: {run.summary()}")
+        weeks = run.pending()
+        # Las fallidas van sin If-None-Match / If-Modified-Since: nunca vuelven como 304
+        unconditional = set(run.failed)
+        current = run.current_week or 1
+        if run.detect_failed:
+            # La jornada detectada entonces puede ser errónea: se repite la detección y su plan
+            with m.phase("detect"):
+                current = detect_current_week(cfg, schedule, now_madrid, max_workers, run, fetched)
+            plan = build_refresh_plan(_meta(cfg), schedule, range(1, cfg.season_weeks + 1), now_madrid)
+            weeks = sorted(set(weeks) | set(plan.fetch))
+    else:
+        unconditional = set()
+        run = RunCheckpoint.new(cfg.meta_dir)
+        with m.phase("detect"):
+            current = forced_week if forced_week else detect_current_week(cfg, schedule, now_madrid, max_workers, run, fetched)
+
+        if forced_week or force:
+            weeks = week_window(current, cfg.season_weeks)
+        else:
+            plan = build_refresh_plan(_meta(cfg), schedule, range(1, cfg.season_weeks + 1), now_madrid)
+            print(f"🧭 [{cfg.name}] Jornada actual {current}; plan: {plan.summary()}")
+            weeks = plan.fetch
+
+    print(f"🗓️ [{cfg.name}] Descargando semanas: {weeks}")
+    m.count_week("planned", len(weeks))
+    run.plan(current, weeks)
+    run.save()
+
+    updates = process_weeks(cfg, weeks, schedule, max_workers, run, fetched, unconditional)
+    fetched.clear()
+    updates.update(retry_failed(cfg, run, schedule, max_workers))
+    run.finish()
+    run.save()
+    schedule.save()
+    _meta(cfg).flush()
+    w = m.weeks
+    print(f"🧮 [{cfg.name}] Semanas: {w['changed']} cambiadas, {w['unchanged']} sin cambios, {w['failed']} fallidas.")
+    if not run.complete:
+        print(f"⚠️  [{cfg.name}] Ejecución incompleta ({run.summary()}); `run.py --resume` repite solo lo pendiente.")
+
+    # Un único merge al final, solo con las semanas que han cambiado
+    changed = {w: u.matches for w, u in updates.items()}
+    main_json_path = cfg.main_json_path
+    if changed or not main_json_path.exists():
+        all_weeks = update_main_json(cfg, main_json_path, changed, rows={w: u.rows for w, u in updates.items()})
+    else:
+        print(f"🟢 [{cfg.name}] Ninguna semana ha cambiado; {main_json_path.name} intacto.")
+        # Aun sin cambios, se generan las salidas derivadas que falten (p. ej. primer despliegue)
+        all_weeks = _load_main_json(main_json_path) if _derived_outputs_missing(cfg) else None
+
+    if all_weeks is not None:
+        write_derived_outputs(cfg, all_weeks, set(changed))
@@ -0,0 +1,88 @@
+"""
+Plan de refresco según el estado de cada jornada.
+
+Con el resumen de estado que guarda meta/index.json (partidos, terminados,
+próximo kickoff pendiente) y la última comprobación de cada semana, decide qué
+jornadas merece la pena pedir a la API en esta ejecución:
+
+    finalizada   todos los partidos FullTime              -> nunca (salvo --force)
+    inminente    kickoff pendiente entre -1 día y +36 h   -> siempre
+    atrasada     kickoff pendiente hace más de 1 día      -> si no se comprobó en 20 h
+                 (aplazados o resultados sin cerrar)
+    próxima      kickoff pendiente en < 14 días           -> si no se comprobó en 20 h
+    lejana       resto                                    -> si no se comprobó en 7 días
+    sin datos    nunca descargada                         -> siempre
+
+La última comprobación es checked_at (meta/checks.json) o, si no está (p. ej.
+un checkout nuevo sin la caché del workflow), fetched_at de index.json.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from scraper.meta_store import MetaStore
+from scraper.schedule import ScheduleIndex
+
+IMMINENT = timedelta(hours=36)
+OVERDUE = timedelta(days=1)
+NEAR = timedelta(days=14)
+NEAR_RECHECK = timedelta(hours=20)     # una vez al día con el cron diario
+FAR_RECHECK = timedelta(days=7)
+
+
+@dataclass
+class RefreshPlan:
+    fetch: list[int] = field(default_factory=list)
+    reasons: dict[int, str] = field(default_factory=dict)   # semana -> motivo (pedidas y omitidas)
+
+    def skipped(self) -> list[int]:
+        return [w for w in self.reasons if w not in self.fetch]
+
+    def summary(self) -> str:
+        counts: dict[str, int] = {}
+        for w, reason in self.reasons.items():
+            if w not in self.fetch:
+                counts[reason] = counts.get(reason, 0) + 1
+        skipped = ", ".join(f"{n} {reason}" for reason, n in sorted(counts.items()))
+        return f"pedir {self.fetch or 'ninguna'}" + (f" · omitidas: {skipped}" if skipped else "")
+
+
+def _parse(iso: str | None) -> datetime | None:
+    try:
+        return datetime.fromisoformat(iso) if iso else None
+    except ValueError:
+        return None
+
+
+def classify_week(entry: dict, schedule_range: tuple[datetime, datetime] | None, now: datetime) -> tuple[bool, str]:
+    """(pedir?, motivo) para una semana a partir de su entrada de meta."""
+    state = entry.get("state")
+    if not state:
+        return True, "sin datos"
+    if state.get("matches") and state.get("finished") == state.get("matches"):
+        return False, "finalizada"
+
+    next_kickoff = _parse(state.get("next_kickoff"))
+    if next_kickoff is None and schedule_range is not None:
+        next_kickoff = schedule_range[0]
+    checked = _parse(entry.get("checked_at") or entry.get("fetched_at"))
+
+    due_daily = checked is None or now - checked >= NEAR_RECHECK
+    if next_kickoff is not None and now - next_kickoff > OVERDUE:
+        return (True, "atrasada") if due_daily else (False, "atrasada (ya comprobada)")
+    if next_kickoff is not None and next_kickoff - now <= IMMINENT:
+        return True, "inminente"
+    if next_kickoff is not None and next_kickoff - now <= NEAR:
+        return (True, "próxima") if due_daily else (False, "próxima (ya comprobada)")
+    if checked is None or now - checked >= FAR_RECHECK:
+        return True, "lejana"
+    return False, "lejana (ya comprobada)"
+
+
+def build_refresh_plan(meta: MetaStore, schedule: ScheduleIndex, weeks, now: datetime) -> RefreshPlan:
+    plan = RefreshPlan()
+    for week in weeks:
+        fetch, reason = classify_week(meta.get(week), schedule.weeks.get(week), now)
+        plan.reasons[week] = reason
+        if fetch:
+            plan.fetch.append(week)
+    return plan
@@ -0,0 +1,153 @@
+"""
+Índice persistente jornada -> (primer, último) kickoff por liga.
+
+Sustituye el barrido de las 38 jornadas por red en cada ejecución: el índice se
+guarda en meta/schedule.json, se reconstruye a partir de los ficheros de semana
+ya descargados y la jornada actual se obtiene con una búsqueda binaria en memoria.
+La red solo se usa para rellenar jornadas que falten o cuando el índice caduca.
+Las jornadas que la API devuelve sin partidos (o sin horarios) se guardan en
+"empty": no cuentan como faltantes y se vuelven a mirar con el índice entero,
+cada SCHEDULE_MAX_AGE. Si alguna jornada falla al rehacer el índice entero, el
+índice se da por construido igual y solo esa queda como faltante.
+"""
+import json
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from scraper.canonical import write_atomic
+
+SCHEDULE_FILE = "schedule.json"
+SCHEDULE_MAX_AGE = timedelta(days=7)
+
+
+def _to_iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat()
+
+
+class ScheduleIndex:
+    def __init__(self, path: Path, weeks: dict[int, tuple[datetime, datetime]] | None = None,
+                 built_at: datetime | None = None, empty=()):
+        self.path = path
+        self.weeks = dict(weeks or {})
+        self.empty: set[int] = set(empty) - set(self.weeks)   # jornadas sin kickoffs conocidos
+        self.built_at = built_at
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    # ---------- persistencia ----------
+    @classmethod
+    def load(cls, meta_dir: Path) -> "ScheduleIndex":
+        path = meta_dir / SCHEDULE_FILE
+        if not path.exists():
+            return cls(path)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            weeks = {
+                int(w): (datetime.fromisoformat(lo), datetime.fromisoformat(hi))
+                for w, (lo, hi) in raw.get("weeks", {}).items()
+            }
+            built_at = datetime.fromisoformat(raw["built_at"]) if raw.get("built_at") else None
+            empty = [int(w) for w in raw.get("empty", [])]
+        except Exception:
+            # Índice corrupto: se reconstruye desde cero
+            return cls(path)
+        return cls(path, weeks, built_at, empty)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "built_at": _to_iso(self.built_at) if self.built_at else None,
+                "weeks": {
+                    str(w): [_to_iso(lo), _to_iso(hi)]
+                    for w, (lo, hi) in sorted(self.weeks.items())
+                },
+                "empty": sorted(self.empty),
+            }
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path, json.dumps(payload, indent=2))
+
+    # ---------- mantenimiento ----------
+    def update_week(self, week: int, kickoffs: list[datetime]):
+        """
+        Actualiza la jornada con los kickoffs conocidos (los None se ignoran).
+        Sin ninguno, la jornada queda como vacía salvo que ya tuviera fechas.
+        """
+        kickoffs = [k for k in kickoffs if k is not None]
+        with self._lock:
+            if not kickoffs:
+                if week not in self.weeks and week not in self.empty:
+                    self.empty.add(week)
+                    self._dirty = True
+                return
+            entry = (min(kickoffs), max(kickoffs))
+            if self.weeks.get(week) != entry:
+                self.weeks[week] = entry
+                self._dirty = True
+            if week in self.empty:
+                self.empty.discard(week)
+                self._dirty = True
+
+    def forget(self, weeks):
+        """Saca las jornadas del índice: vuelven a salir en missing()."""
+        with self._lock:
+            for week in weeks:
+                if self.weeks.pop(week, None) is not None or week in self.empty:
+                    self.empty.discard(week)
+                    self._dirty = True
+
+    def mark_built(self, now: datetime):
+        with self._lock:
+            self.built_at = now
+            self._dirty = True
+
+    def is_stale(self, now: datetime, max_age: timedelta = SCHEDULE_MAX_AGE) -> bool:
+        return self.built_at is None or now - self.built_at > max_age
+
+    def missing(self, season_weeks: int) -> list[int]:
+        return [w for w in range(1, season_weeks + 1) if w not in self.weeks and w not in self.empty]
+
+    def rebuild_from_files(self, out_dir_json: Path, season_weeks: int, parse_matches, kickoff_of):
+        """Rellena el índice con los matches_week_{n}.json ya guardados."""
+        for week in range(1, season_weeks + 1):
+            if week in self.weeks or week in self.empty:
+                continue
+            path = out_dir_json / f"matches_week_{week}.json"
+            if not path.exists():
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    matches = parse_matches(json.load(f))
+            except Exception:
+                continue
+            self.update_week(week, [kickoff_of(m) for m in matches])
+
+    # ---------- consulta ----------
+    def current_week(self, now: datetime) -> int | None:
+        """
+        Jornada más cercana a `now` por búsqueda binaria sobre el primer kickoff.
+        Solo se comparan la última jornada ya empezada y la siguiente: distancia 0
+        si `now` cae dentro de la jornada, si no la distancia al extremo más próximo.
+        """
+        if not self.weeks:
+            return None
+        ordered = sorted(self.weeks.items(), key=lambda kv: kv[1][0])
+        starts = [lo for _, (lo, _) in ordered]
+        pos = bisect_right(starts, now)
+
+        best_week, best_delta = None, None
+        for i in (pos - 1, pos):
+            if not 0 <= i < len(ordered):
+                continue
+            week, (lo, hi) = ordered[i]
+            if lo <= now <= hi:
+                delta = 0.0
+            else:
+                delta = min(abs((lo - now).total_seconds()), abs((hi - now).total_seconds()))
+            if best_delta is None or delta < best_delta:
+                best_week, best_delta = week, delta
+        return best_week
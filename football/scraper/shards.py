@@ -0,0 +1,81 @@
+"""
+Salida troceada por jornada para carga incremental en la web.
+
+Junto a matches_<liga>.json se escriben:
+
+    weeks/week_{n}.json   filas de la jornada (JSON compacto)
+    manifest.json         {"revision": ..., "shards": {"n": {"file", "hash", "matches"}}}
+
+El cliente descarga solo el manifest y las jornadas cuyo hash no coincide con
+lo que ya tiene en caché. Un shard solo se reescribe si su hash cambia.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+from scraper.canonical import write_atomic
+from scraper.meta_store import utc_now_iso
+
+MANIFEST_FILE = "manifest.json"
+SHARDS_DIR = "weeks"
+MANIFEST_VERSION = 1
+
+
+def _shard_bytes(rows: list[dict]) -> bytes:
+    return json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _short_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def manifest_path(league_dir: Path) -> Path:
+    return league_dir / MANIFEST_FILE
+
+
+def load_manifest(league_dir: Path) -> dict | None:
+    path = manifest_path(league_dir)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def write_shards(league_dir: Path, all_weeks: dict[str, list[dict]]) -> list[int]:
+    """
+    Sincroniza weeks/ y manifest.json con all_weeks (semana -> filas).
+    Devuelve las jornadas cuyo shard se ha (re)escrito.
+    """
+    manifest = load_manifest(league_dir) or {}
+    old = manifest.get("shards", {})
+    shards_dir = league_dir / SHARDS_DIR
+    shards_dir.mkdir(parents=True, exist_ok=True)
+
+    shards, written = {}, []
+    for key in sorted(all_weeks, key=int):
+        raw = _shard_bytes(all_weeks[key])
+        digest = _short_hash(raw)
+        rel = f"{SHARDS_DIR}/week_{key}.json"
+        if old.get(key, {}).get("hash") != digest or not (league_dir / rel).exists():
+            write_atomic(league_dir / rel, raw)
+            written.append(int(key))
+        shards[key] = {"file": rel, "hash": digest, "matches": len(all_weeks[key])}
+
+    # Jornadas que ya no existen
+    for key in set(old) - set(shards):
+        (league_dir / old[key].get("file", f"{SHARDS_DIR}/week_{key}.json")).unlink(missing_ok=True)
+
+    if shards == old and manifest.get("version") == MANIFEST_VERSION:
+        return written
+
+    revision = _short_hash("".join(f"{k}:{v['hash']};" for k, v in shards.items()).encode("utf-8"))
+    payload = {
+        "version": MANIFEST_VERSION,
+        "revision": revision,
+        "updated": utc_now_iso(),
+        "shards": shards,
+    }
+    write_atomic(manifest_path(league_dir), json.dumps(payload, ensure_ascii=False, indent=1))
+    return written
@@ -0,0 +1,173 @@
+"""
+Clasificación precalculada por liga: standings_<liga>.json.
+
+Se mantiene de forma incremental en meta/standings.json: por jornada se guarda
+su aportación (partidos jugados de cada equipo) y, aparte, los acumulados por
+equipo. En cada ejecución solo se recalculan las jornadas que han cambiado: se
+resta su aportación anterior y se suma la nueva.
+
+Orden: puntos, diferencia de goles, goles a favor y nombre (sin
+enfrentamientos directos). Forma = últimos 5 resultados por fecha (G/E/P).
+"""
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+from scraper.canonical import parse_score, row_sort_key, write_atomic
+from scraper.meta_store import utc_now_iso
+
+STATE_FILE = "standings.json"
+STATE_VERSION = 1
+FORM_LENGTH = 5
+
+# Acumulados por equipo: [PJ, G, E, P, GF, GC]
+PJ, G, E, P, GF, GC = range(6)
+
+
+def standings_path(league_dir: Path, slug: str) -> Path:
+    return league_dir / f"standings_{slug}.json"
+
+
+def week_results(rows: list[dict]) -> tuple[list[str], list[list]]:
+    """(equipos de la jornada, [[equipo, fecha, gf, gc], ...] de los partidos jugados)."""
+    teams, results = set(), []
+    for row in rows:
+        local, visitante = row.get("Local") or "", row.get("Visitante") or ""
+        teams.update(t for t in (local, visitante) if t)
+        score = parse_score(row.get("Resultado"))
+        if not score or not local or not visitante:
+            continue
+        hs, as_ = score
+        day, hora, _ = row_sort_key(row)
+        key = f"{day} {hora}"
+        results.append([local, key, hs, as_])
+        results.append([visitante, key, as_, hs])
+    return sorted(teams), results
+
+
+def _rows_hash(rows: list[dict]) -> str:
+    raw = json.dumps(rows, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class StandingsTable:
+    def __init__(self, path: Path, weeks: dict[int, dict] | None = None, totals: dict[str, list[int]] | None = None):
+        self.path = path
+        self.weeks = dict(weeks or {})      # jornada -> {"hash", "teams", "results"}
+        self.totals = dict(totals or {})    # equipo -> [PJ, G, E, P, GF, GC]
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    # ---------- persistencia ----------
+    @classmethod
+    def load(cls, meta_dir: Path) -> "StandingsTable":
+        path = meta_dir / STATE_FILE
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("version") != STATE_VERSION:
+                return cls(path)
+            weeks = {int(w): v for w, v in raw.get("weeks", {}).items()}
+            return cls(path, weeks, raw.get("totals", {}))
+        except (OSError, ValueError):
+            # Sin estado (o corrupto): se reconstruye desde todas las jornadas
+            return cls(path)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": STATE_VERSION,
+                "totals": dict(sorted(self.totals.items())),
+                "weeks": {str(w): self.weeks[w] for w in sorted(self.weeks)},
+            }
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.path, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+    # ---------- actualización incremental ----------
+    def _apply(self, results: list[list], sign: int):
+        for team, _, gf, gc in results:
+            t = self.totals.setdefault(team, [0, 0, 0, 0, 0, 0])
+            t[PJ] += sign
+            t[G if gf > gc else E if gf == gc else P] += sign
+            t[GF] += sign * gf
+            t[GC] += sign * gc
+            if not any(t):
+                del self.totals[team]
+
+    def update_week(self, week: int, rows: list[dict]) -> bool:
+        """Sustituye la aportación de la jornada. Devuelve True si ha cambiado algo."""
+        digest = _rows_hash(rows)
+        with self._lock:
+            old = self.weeks.get(week)
+            if old and old.get("hash") == digest:
+                return False
+            teams, results = week_results(rows)
+            if old:
+                self._apply(old["results"], -1)
+            self._apply(results, +1)
+            self.weeks[week] = {"hash": digest, "teams": teams, "results": results}
+            self._dirty = True
+            return True
+
+    def drop_week(self, week: int):
+        with self._lock:
+            old = self.weeks.pop(week, None)
+            if old:
+                self._apply(old["results"], -1)
+                self._dirty = True
+
+    def sync(self, all_weeks: dict[str, list[dict]], changed: set[int] | None = None) -> list[int]:
+        """
+        Aplica las jornadas cambiadas (o todas si changed es None o no hay estado).
+        Devuelve las jornadas recalculadas.
+        """
+        present = {int(w) for w in all_weeks}
+        if changed is None or not self.weeks:
+            todo = present
+        else:
+            todo = set(changed) | (present - set(self.weeks))
+        for week in set(self.weeks) - present:
+            self.drop_week(week)
+        return [w for w in sorted(todo & present) if self.update_week(w, all_weeks[str(w)])]
+
+    # ---------- salida ----------
+    def _form(self) -> dict[str, str]:
+        history: dict[str, list[tuple[str, str]]] = {}
+        for entry in self.weeks.values():
+            for team, key, gf, gc in entry["results"]:
+                history.setdefault(team, []).append((key, "G" if gf > gc else "E" if gf == gc else "P"))
+        return {
+            team: "".join(r for _, r in sorted(items)[-FORM_LENGTH:])
+            for team, items in history.items()
+        }
+
+    def table(self) -> list[dict]:
+        teams = set(self.totals)
+        for entry in self.weeks.values():
+            teams.update(entry["teams"])
+        form = self._form()
+        rows = []
+        for team in teams:
+            pj, g, e, p, gf, gc = self.totals.get(team, [0, 0, 0, 0, 0, 0])
+            rows.append({
+                "Equipo": team, "PJ": pj, "G": g, "E": e, "P": p,
+                "GF": gf, "GC": gc, "DG": gf - gc, "Pts": 3 * g + e,
+                "Forma": form.get(team, ""),
+            })
+        rows.sort(key=lambda r: (-r["Pts"], -r["DG"], -r["GF"], r["Equipo"]))
+        return [{"Pos": i, **r} for i, r in enumerate(rows, 1)]
+
+    def write_output(self, path: Path, league: str) -> bool:
+        """Escribe standings_<liga>.json si la tabla ha cambiado. Devuelve True si se escribió."""
+        table = self.table()
+        try:
+            if json.loads(path.read_text(encoding="utf-8")).get("table") == table:
+                return False
+        except (OSError, ValueError):
+            pass
+        payload = {"league": league, "updated": utc_now_iso(), "table": table}
+        write_atomic(path, json.dumps(payload, ensure_ascii=False, indent=1))
+        return True
@@ -0,0 +1,214 @@
+"""
+Almacén local de partidos en SQLite (opcional: FOOTBALL_STORE=<ruta.sqlite>).
+
+Una fila por partido, con clave (liga, temporada, jornada, local, visitante) e
+índices por liga/temporada/jornada, equipo y kickoff. Lo alimentan el pipeline
+(jornadas que cambian) y el backfill (temporadas completas) con upserts
+idempotentes: repetir la misma jornada no cambia nada.
+
+Consultas (matches, head_to_head, team_results) y exportadores que devuelven
+las mismas estructuras que los JSON de football/data:
+
+    export_league  -> matches_<liga>.json      {jornada: filas}
+    export_week    -> weeks/week_{n}.json      filas
+    export_team    -> teams/<equipo>.json      {"team", "slug", "matches"}
+"""
+import os
+import sqlite3
+from pathlib import Path
+
+from scraper.canonical import parse_score, row_sort_key
+from scraper.compact import kickoff_epoch
+from scraper.meta_store import utc_now_iso
+from scraper.teams import team_slug
+
+STORE_PATH = os.environ.get("FOOTBALL_STORE", "")   # vacío = sin almacén
+SEASON_START_MONTH = 7                                # julio: partidos desde aquí son de la temporada que empieza
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    league      TEXT    NOT NULL,
+    season      INTEGER NOT NULL,
+    jornada     INTEGER NOT NULL,
+    local       TEXT    NOT NULL,
+    visitante   TEXT    NOT NULL,
+    fecha       TEXT    NOT NULL,
+    horario     TEXT    NOT NULL,
+    day         TEXT    NOT NULL,
+    kickoff     INTEGER,
+    resultado   TEXT    NOT NULL,
+    goles_local INTEGER,
+    goles_visitante INTEGER,
+    updated     TEXT    NOT NULL,
+    PRIMARY KEY (league, season, jornada, local, visitante)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_matches_local     ON matches (local, league, season);
+CREATE INDEX IF NOT EXISTS idx_matches_visitante ON matches (visitante, league, season);
+CREATE INDEX IF NOT EXISTS idx_matches_kickoff   ON matches (kickoff);
+"""
+
+# Mismo orden que canonical.row_sort_key dentro de cada jornada
+_ORDER = "ORDER BY league, season, jornada, day, horario, local"
+
+
+def infer_season(all_weeks: dict[str, list[dict]]) -> int | None:
+    """Año de inicio de la temporada a partir de la primera fecha de los partidos."""
+    days = [d for rows in all_weeks.values() for d, _, _ in map(row_sort_key, rows) if d]
+    if not days:
+        return None
+    year, month = int(min(days)[:4]), int(min(days)[5:7])
+    return year if month >= SEASON_START_MONTH else year - 1
+
+
+def _record(league: str, season: int, jornada: int, row: dict, updated: str) -> tuple:
+    day, hora, _ = row_sort_key(row)
+    resultado = row.get("Resultado") or "VS"
+    score = parse_score(resultado) or (None, None)
+    return (
+        league, season, jornada, row.get("Local") or "", row.get("Visitante") or "",
+        row.get("Fecha") or "", hora, day, kickoff_epoch(row), resultado,
+        *score, updated,
+    )
+
+
+def _row(r: sqlite3.Row) -> dict:
+    """Fila con la forma de matches_<liga>.json."""
+    return {
+        "Jornada": r["jornada"],
+        "Fecha": r["fecha"],
+        "Horario": r["horario"],
+        "Local": r["local"],
+        "Resultado": r["resultado"],
+        "Visitante": r["visitante"],
+    }
+
+
+class MatchStore:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Varias ligas (procesos) pueden escribir a la vez: WAL + espera al bloqueo
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- escritura ----------
+    def upsert_week(self, league: str, season: int, jornada: int, rows: list[dict]) -> int:
+        """
+        Deja la jornada exactamente como `rows`: inserta o actualiza cada partido
+        y borra los que ya no están. Devuelve cuántas filas han cambiado.
+        """
+        updated = utc_now_iso()
+        records = [_record(league, season, jornada, r, updated) for r in rows]
+        with self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                """
+                INSERT INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (league, season, jornada, local, visitante) DO UPDATE SET
+                    fecha = excluded.fecha, horario = excluded.horario, day = excluded.day,
+                    kickoff = excluded.kickoff, resultado = excluded.resultado,
+                    goles_local = excluded.goles_local, goles_visitante = excluded.goles_visitante,
+                    updated = excluded.updated
+                WHERE (fecha, horario, resultado) IS NOT (excluded.fecha, excluded.horario, excluded.resultado)
+                """,
+                records,
+            )
+            keep = {(r[3], r[4]) for r in records}
+            stale = [
+                (league, season, jornada, r["local"], r["visitante"])
+                for r in self.conn.execute(
+                    "SELECT local, visitante FROM matches WHERE league = ? AND season = ? AND jornada = ?",
+                    (league, season, jornada),
+                )
+                if (r["local"], r["visitante"]) not in keep
+            ]
+            self.conn.executemany(
+                "DELETE FROM matches WHERE league = ? AND season = ? AND jornada = ? AND local = ? AND visitante = ?",
+                stale,
+            )
+            return self.conn.total_changes - before
+
+    def upsert_weeks(self, league: str, season: int, all_weeks: dict[str, list[dict]], weeks=None) -> int:
+        """upsert_week de las jornadas indicadas (None = todas). Devuelve las filas cambiadas."""
+        keys = sorted(all_weeks, key=int) if weeks is None else [str(w) for w in sorted(weeks)]
+        return sum(self.upsert_week(league, season, int(k), all_weeks.get(k, [])) for k in keys)
+
+    def has_season(self, league: str, season: int) -> bool:
+        cur = self.conn.execute("SELECT 1 FROM matches WHERE league = ? AND season = ? LIMIT 1", (league, season))
+        return cur.fetchone() is not None
+
+    # ---------- consultas ----------
+    def matches(self, league: str | None = None, season: int | None = None, jornada: int | None = None,
+                team: str | None = None, home: bool | None = None, played: bool | None = None,
+                since: int | None = None, until: int | None = None) -> list[dict]:
+        """
+        Partidos filtrados. team + home=True/False = solo en casa / fuera;
+        played = con resultado o sin él; since/until = kickoff en segundos epoch.
+        """
+        where, params = [], []
+        for column, value in (("league", league), ("season", season), ("jornada", jornada)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(value)
+        if team is not None:
+            if home is None:
+                where.append("(local = ? OR visitante = ?)")
+                params += [team, team]
+            else:
+                where.append("local = ?" if home else "visitante = ?")
+                params.append(team)
+        if played is not None:
+            where.append("goles_local IS NOT NULL" if played else "goles_local IS NULL")
+        if since is not None:
+            where.append("kickoff >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("kickoff < ?")
+            params.append(until)
+        sql = "SELECT * FROM matches" + (" WHERE " + " AND ".join(where) if where else "") + f" {_ORDER}"
+        return [_row(r) for r in self.conn.execute(sql, params)]
+
+    def head_to_head(self, team_a: str, team_b: str, league: str | None = None) -> list[dict]:
+        sql = "SELECT * FROM matches WHERE ((local = ? AND visitante = ?) OR (local = ? AND visitante = ?))"
+        params = [team_a, team_b, team_b, team_a]
+        if league is not None:
+            sql += " AND league = ?"
+            params.append(league)
+        return [_row(r) for r in self.conn.execute(f"{sql} {_ORDER}", params)]
+
+    def team_results(self, team: str, home: bool | None = None, league: str | None = None) -> list[dict]:
+        """Partidos ya jugados de un equipo en todas las temporadas guardadas."""
+        return self.matches(league=league, team=team, home=home, played=True)
+
+    def seasons(self, league: str) -> list[int]:
+        cur = self.conn.execute("SELECT DISTINCT season FROM matches WHERE league = ? ORDER BY season", (league,))
+        return [r["season"] for r in cur]
+
+    # ---------- exportadores ----------
+    def export_week(self, league: str, season: int, jornada: int) -> list[dict]:
+        return self.matches(league=league, season=season, jornada=jornada)
+
+    def export_league(self, league: str, season: int) -> dict[str, list[dict]]:
+        all_weeks: dict[str, list[dict]] = {}
+        for row in self.matches(league=league, season=season):
+            all_weeks.setdefault(str(row["Jornada"]), []).append(row)
+        return all_weeks
+
+    def export_team(self, league: str, season: int, team: str) -> dict:
+        return {"team": team, "slug": team_slug(team), "matches": self.matches(league=league, season=season, team=team)}
+
+
+def open_store() -> MatchStore | None:
+    """Almacén configurado en FOOTBALL_STORE, o None si no hay."""
+    return MatchStore(STORE_PATH) if STORE_PATH else None
@@ -0,0 +1,97 @@
+"""
+Índice de partidos por equipo para las vistas filtradas por equipo.
+
+Junto a matches_<liga>.json se escriben:
+
+    teams/<equipo>.json   {"team", "slug", "matches": [filas del equipo]}
+    teams/index.json      directorio {"teams": {slug: {"name", "file", "hash", "matches"}}}
+
+Solo se reescriben los ficheros de los equipos que juegan en las jornadas que
+han cambiado (o cuyo contenido ya no coincide con el directorio).
+"""
+import hashlib
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+from scraper.canonical import write_atomic
+from scraper.meta_store import utc_now_iso
+
+TEAMS_DIR = "teams"
+DIRECTORY_FILE = "index.json"
+
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+def team_slug(name: str) -> str:
+    """'Atlético de Madrid' -> 'atletico-de-madrid'."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return _NON_SLUG.sub("-", ascii_name.lower()).strip("-") or "equipo"
+
+
+def _team_bytes(name: str, slug: str, rows: list[dict]) -> bytes:
+    payload = {"team": name, "slug": slug, "matches": rows}
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_directory(league_dir: Path) -> dict:
+    try:
+        return json.loads((league_dir / TEAMS_DIR / DIRECTORY_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _teams_in(rows: list[dict]) -> set[str]:
+    return {t for r in rows for t in (r.get("Local"), r.get("Visitante")) if t}
+
+
+def write_team_index(league_dir: Path, all_weeks: dict[str, list[dict]], changed: set[int] | None = None) -> list[str]:
+    """
+    Sincroniza teams/ con all_weeks. changed = jornadas que han cambiado
+    (None = revisar todos los equipos). Devuelve los slugs (re)escritos.
+    """
+    by_team: dict[str, list[dict]] = {}
+    for key in sorted(all_weeks, key=int):
+        for row in all_weeks[key]:
+            for team in (row.get("Local"), row.get("Visitante")):
+                if team:
+                    by_team.setdefault(team, []).append(row)
+
+    directory = load_directory(league_dir)
+    old = directory.get("teams", {})
+    teams_dir = league_dir / TEAMS_DIR
+    teams_dir.mkdir(parents=True, exist_ok=True)
+
+    if changed is None:
+        candidates = set(by_team)
+    else:
+        candidates = set()
+        for week in changed:
+            candidates |= _teams_in(all_weeks.get(str(week), []))
+
+    entries, written = {}, []
+    for name in sorted(by_team):
+        slug = team_slug(name)
+        rows = by_team[name]
+        prev = old.get(slug)
+        rel = f"{TEAMS_DIR}/{slug}.json"
+        if (name not in candidates and prev and prev.get("name") == name
+                and prev.get("matches") == len(rows) and (league_dir / rel).exists()):
+            entries[slug] = prev
+            continue
+        raw = _team_bytes(name, slug, rows)
+        digest = hashlib.sha256(raw).hexdigest()[:16]
+        if not prev or prev.get("hash") != digest or not (league_dir / rel).exists():
+            write_atomic(league_dir / rel, raw)
+            written.append(slug)
+        entries[slug] = {"name": name, "file": rel, "hash": digest, "matches": len(rows)}
+
+    # Equipos que ya no aparecen
+    for slug in set(old) - set(entries):
+        (league_dir / old[slug].get("file", f"{TEAMS_DIR}/{slug}.json")).unlink(missing_ok=True)
+
+    if entries != old:
+        payload = {"updated": utc_now_iso(), "teams": entries}
+        write_atomic(teams_dir / DIRECTORY_FILE, json.dumps(payload, ensure_ascii=False, indent=1))
+    return written
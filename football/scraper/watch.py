@@ -0,0 +1,165 @@
+"""
+Modo --watch: proceso de larga duración para resultados casi en directo.
+
+Tras una ejecución normal (process_league) el calendario, los metadatos y
+matches_<liga>.json quedan en memoria. A partir de ahí solo se piden las
+jornadas con partidos en juego, cada `interval` segundos; si no hay ninguno, se
+duerme hasta el siguiente kickoff (como mucho MAX_IDLE). Al despertar se
+rellena el calendario y se repite el plan de refresco, por si se ha movido
+algún partido o han aparecido jornadas nuevas. Los ficheros solo se escriben
+cuando algo cambia (y al salir, los metadatos pendientes).
+
+Los kickoffs a las 00:00 UTC son horarios sin confirmar: sirven para despertar,
+pero no cuentan como partido en juego.
+"""
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+from scraper.concurrency import DEFAULT_WORKERS
+from scraper.leagues import LeagueConfig
+from scraper.meta_store import MetaStore
+from scraper.normalize import is_time_placeholder
+from scraper.pipeline import (FetchedWeek, process_league, process_weeks, refresh_schedule, update_main_json,
+                              write_derived_outputs)
+from scraper.refresh import NEAR, build_refresh_plan
+from scraper.schedule import ScheduleIndex
+
+# =========================
+# CONFIG
+# =========================
+DEFAULT_INTERVAL = 60                  # segundos entre consultas con partidos en juego
+LIVE_WINDOW = timedelta(hours=3)       # tras el kickoff, tiempo máximo "en juego" si la API no lo cierra
+MAX_IDLE = timedelta(hours=6)          # sueño máximo sin partidos (por si cambia el calendario)
+
+
+class LeagueWatcher:
+    def __init__(self, cfg: LeagueConfig, interval: float = DEFAULT_INTERVAL, max_workers: int = DEFAULT_WORKERS):
+        self.cfg = cfg
+        self.interval = interval
+        self.max_workers = max_workers
+        self.schedule: ScheduleIndex | None = None
+        self.all_weeks: dict[str, list[dict]] = {}
+        self.pending: dict[int, list[datetime]] = {}   # semana -> kickoffs de partidos sin terminar
+        self._stop = threading.Event()
+
+    @property
+    def meta(self) -> MetaStore:
+        return MetaStore.for_dir(self.cfg.meta_dir)
+
+    def stop(self):
+        self._stop.set()
+
+    # ---------- estado en memoria ----------
+    def _track(self, week: int, matches: list):
+        adapter = self.cfg.adapter
+        kickoffs = [adapter.match_kickoff(m) for m in matches if not adapter.match_finished(m)]
+        kickoffs = [k if k.tzinfo else k.replace(tzinfo=timezone.utc) for k in kickoffs if k is not None]
+        if kickoffs:
+            self.pending[week] = kickoffs
+        else:
+            self.pending.pop(week, None)
+
+    def _read_week(self, week: int) -> list:
+        path = self.cfg.out_dir_json / f"matches_week_{week}.json"
+        try:
+            return self.cfg.adapter.parse_matches(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            return []
+
+    def start(self, forced_week: int | None = None, force: bool = False):
+        """Ejecución normal y carga del estado que se mantiene en memoria."""
+        cfg = self.cfg
+        process_league(cfg, forced_week=forced_week, max_workers=self.max_workers, force=force)
+        self.schedule = ScheduleIndex.load(cfg.meta_dir)
+        if cfg.main_json_path.exists():
+            self.all_weeks = json.loads(cfg.main_json_path.read_text(encoding="utf-8"))
+        for week, entry in self.meta.weeks.items():
+            state = entry.get("state") or {}
+            if state.get("finished", 0) < state.get("matches", 0):
+                self._track(week, self._read_week(week))
+
+    def live_weeks(self, now: datetime) -> list[int]:
+        return sorted(
+            w for w, kickoffs in self.pending.items()
+            if any(k <= now < k + LIVE_WINDOW and not is_time_placeholder(k) for k in kickoffs)
+        )
+
+    def next_kickoff(self, now: datetime) -> datetime | None:
+        upcoming = [k for kickoffs in self.pending.values() for k in kickoffs if k > now]
+        return min(upcoming) if upcoming else None
+
+    # ---------- bucle ----------
+    def poll(self, weeks: list[int]) -> list[int]:
+        """Consulta las jornadas en juego. Devuelve las que han cambiado."""
+        return self._apply(process_weeks(self.cfg, weeks, self.schedule, self.max_workers))
+
+    def replan(self, now: datetime) -> list[int]:
+        """
+        Tras un periodo sin partidos: calendario de las jornadas que falten, plan
+        de refresco de nuevo y, sin esperar a su recomprobación diaria, las
+        jornadas con partidos pendientes en menos de NEAR (aplazamientos,
+        horarios confirmados). Devuelve las jornadas que han cambiado.
+        """
+        cfg = self.cfg
+        fetched: dict[int, FetchedWeek] = {}
+        missing = self.schedule.missing(cfg.season_weeks)
+        if missing:
+            refresh_schedule(cfg, self.schedule, missing, self.max_workers, fetched=fetched)
+        plan = build_refresh_plan(self.meta, self.schedule, range(1, cfg.season_weeks + 1), now)
+        near = {w for w, kickoffs in self.pending.items() if any(k < now + NEAR for k in kickoffs)}
+        weeks = sorted(set(plan.fetch) | set(fetched) | near)
+        if not weeks:
+            return []
+        print(f"🧭 [{cfg.name}] Revisando el calendario: {plan.summary()}")
+        return self._apply(process_weeks(cfg, weeks, self.schedule, self.max_workers, prefetched=fetched))
+
+    def _apply(self, updates: dict) -> list[int]:
+        cfg = self.cfg
+        if not updates:
+            self.flush()
+            return []
+        changed = {w: u.matches for w, u in updates.items()}
+        for week, matches in changed.items():
+            self._track(week, matches)
+        self.all_weeks = update_main_json(cfg, cfg.main_json_path, changed, current=self.all_weeks,
+                                          rows={w: u.rows for w, u in updates.items()})
+        write_derived_outputs(cfg, self.all_weeks, set(changed))
+        self.flush()
+        return sorted(changed)
+
+    def flush(self):
+        self.schedule.save()
+        self.meta.flush()
+
+    def run(self, duration: timedelta | None = None):
+        """Bucle hasta stop() o hasta agotar `duration` (None = sin límite)."""
+        cfg = self.cfg
+        deadline = datetime.now(timezone.utc) + duration if duration else None
+        idle = False   # la vuelta anterior no tenía partidos en juego: se ha dormido
+        try:
+            while not self._stop.is_set():
+                now = datetime.now(timezone.utc)
+                if deadline and now >= deadline:
+                    break
+                if idle:
+                    changed = self.replan(now)
+                    if changed:
+                        print(f"📅 [{cfg.name}] Calendario revisado; cambios en {changed}.")
+                live = self.live_weeks(now)
+                idle = not live
+                if live:
+                    changed = self.poll(live)
+                    if changed:
+                        print(f"⚽ [{cfg.name}] En juego: jornadas {live}; cambios en {changed}.")
+                    wait = timedelta(seconds=self.interval)
+                else:
+                    kickoff = self.next_kickoff(now)
+                    wake = min(kickoff, now + MAX_IDLE) if kickoff else now + MAX_IDLE
+                    print(f"💤 [{cfg.name}] Sin partidos en juego; próxima comprobación {wake:%Y-%m-%d %H:%M} UTC.")
+                    wait = wake - now
+                if deadline:
+                    wait = min(wait, deadline - now)
+                self._stop.wait(max(wait.total_seconds(), 0))
+        finally:
+            self.flush()
@@ -0,0 +1,62 @@
+"""
+Fixtures comunes: liga de prueba contra bench/stub_api.py en un directorio temporal.
+
+    python -m pytest -q football/tests
+"""
+import dataclasses
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # football/ -> import scraper
+
+from bench.fixtures import row_to_matches_api  # noqa: E402
+from bench.stub_api import StubApi  # noqa: E402
+from scraper import concurrency, metrics  # noqa: E402
+from scraper.leagues import LEAGUES, MatchesApiAdapter  # noqa: E402
+from scraper.meta_store import MetaStore  # noqa: E402
+
+TEAMS = ["Real Madrid", "FC Barcelona", "Athletic Club", "Real Betis", "Sevilla FC", "Valencia CF"]
+
+
+def season_payloads(weeks: int, goals: int = 0) -> dict[int, bytes]:
+    """Respuestas {"matches": [...]} de `weeks` jornadas; `goals` cambia todos los resultados."""
+    payloads = {}
+    for week in range(1, weeks + 1):
+        rows = [
+            {
+                "Jornada": week,
+                "Fecha": f"Sáb {week:02d}-09-2025",
+                "Horario": "21:00",
+                "Local": TEAMS[i],
+                "Resultado": f"{goals} - {i % 3}",
+                "Visitante": TEAMS[-1 - i],
+            }
+            for i in range(len(TEAMS) // 2)
+        ]
+        body = {"matches": [row_to_matches_api(r, i) for i, r in enumerate(rows)]}
+        payloads[week] = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    return payloads
+
+
+@pytest.fixture
+def api():
+    concurrency.configure(rate=0, burst=concurrency.DEFAULT_BURST)
+    server = StubApi().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def league(api, tmp_path):
+    """LaLiga apuntando al stub, con datos en tmp_path y estado de proceso limpio."""
+    MetaStore.clear_cache()
+    metrics.reset("laliga")
+    cfg = dataclasses.replace(
+        LEAGUES["laliga"], base_week_url=f"{api.base_url}/laliga", adapter=MatchesApiAdapter(subscription_key="test"),
+        data_dir=tmp_path, season_weeks=12, bulk_url="",
+    )
+    yield cfg
+    MetaStore.clear_cache()
@@ -0,0 +1,56 @@
+import dataclasses
+import json
+
+from conftest import season_payloads
+from scraper import pipeline
+from scraper.checkpoint import BREAKER_REASON, RunCheckpoint
+from scraper.meta_store import MetaStore
+
+
+def test_resume_refetches_failed_weeks_unconditionally(api, league, monkeypatch):
+    monkeypatch.setattr(pipeline, "RETRY_DELAY", -1)
+    api.add_league("laliga", season_payloads(league.season_weeks))
+    pipeline.process_league(league, forced_week=None, max_workers=4)
+
+    # Caída de la API: la ventana forzada falla entera y la ejecución queda incompleta
+    MetaStore.clear_cache()
+    api.error_rate = 1.0
+    pipeline.process_league(league, forced_week=5, max_workers=4)
+    run = RunCheckpoint.load(league.meta_dir)
+    assert not run.complete and run.pending() == [4, 5, 6, 7, 8, 9]
+
+    MetaStore.clear_cache()
+    api.error_rate = 0.0
+    api.reset_stats()
+    pipeline.process_league(league, forced_week=None, max_workers=4, resume=True)
+    # Con validadores guardados el servidor daría 304; las fallidas se piden completas
+    assert api.stats["status"] == {"200": 6}
+    assert RunCheckpoint.load(league.meta_dir).complete
+
+
+def test_not_found_weeks_do_not_open_the_breaker(api, league, monkeypatch):
+    monkeypatch.setattr(pipeline, "RETRY_DELAY", -1)
+    api.add_league("laliga", season_payloads(league.season_weeks))
+    league = dataclasses.replace(league, season_weeks=league.season_weeks + 4)   # 13-16: 404
+    pipeline.process_league(league, forced_week=None, max_workers=4)
+
+    run = json.loads((league.meta_dir / "run.json").read_text(encoding="utf-8"))
+    assert run["breaker"] == "closed"
+    assert set(range(1, 13)) <= set(run["done"])
+    assert BREAKER_REASON not in {f["error"] for f in run["failed"].values()}
+
+
+def test_resume_clears_stale_detection_failures(api, league, monkeypatch):
+    monkeypatch.setattr(pipeline, "RETRY_DELAY", -1)
+    api.add_league("laliga", season_payloads(league.season_weeks))
+    pipeline.process_league(league, forced_week=None, max_workers=4)
+
+    # Ejecución anterior con la detección incompleta; el calendario ya está entero
+    run = RunCheckpoint.load(league.meta_dir)
+    run.detect_failed, run.complete = [7], False
+    run.save()
+
+    MetaStore.clear_cache()
+    pipeline.process_league(league, forced_week=None, max_workers=4, resume=True)
+    run = RunCheckpoint.load(league.meta_dir)
+    assert run.detect_failed == [] and run.complete
@@ -0,0 +1,38 @@
+import threading
+import time
+
+import pytest
+
+from scraper.concurrency import run_stages
+
+
+def test_run_stages_writes_everything_parsed_before_a_failure():
+    parsed, written = [], []
+    lock = threading.Lock()
+
+    def fetch(item):
+        if item == 6:
+            raise RuntimeError("API caída")
+        return item
+
+    def parse(item, value):
+        time.sleep(0.01)   # el parseo va por detrás: hay descargas en cola al fallar
+        with lock:
+            parsed.append(item)
+        return value
+
+    def write(batch):
+        written.extend(item for item, _ in batch)
+
+    with pytest.raises(RuntimeError, match="API caída"):
+        run_stages(range(20), fetch, parse, write, max_workers=2, queue_size=4)
+    assert parsed
+    assert sorted(written) == sorted(parsed)
+
+
+def test_run_stages_stops_when_the_writer_fails():
+    def write(batch):
+        raise OSError("disco lleno")
+
+    with pytest.raises(OSError, match="disco lleno"):
+        run_stages(range(50), lambda i: i, lambda i, v: v, write, max_workers=2, queue_size=2)
@@ -0,0 +1,39 @@
+from conftest import season_payloads
+from scraper import pipeline
+from scraper.meta_store import MetaStore
+from scraper.pipeline import process_league
+from scraper.schedule import ScheduleIndex
+
+
+def test_cold_start_fetches_each_week_once(api, league):
+    api.add_league("laliga", season_payloads(league.season_weeks))
+    process_league(league, forced_week=None, max_workers=4)
+    assert api.stats["status"] == {"200": league.season_weeks}
+
+
+def test_empty_weeks_are_not_refetched_every_run(api, league):
+    payloads = season_payloads(league.season_weeks)
+    payloads[12] = b'{"matches": []}'   # jornada aún sin partidos
+    api.add_league("laliga", payloads)
+    process_league(league, forced_week=None, max_workers=4)
+    assert ScheduleIndex.load(league.meta_dir).empty == {12}
+
+    MetaStore.clear_cache()
+    api.reset_stats()
+    process_league(league, forced_week=None, max_workers=4)
+    assert api.stats["requests"] == 0
+
+
+def test_failed_week_does_not_force_a_full_rescan(api, league, monkeypatch):
+    monkeypatch.setattr(pipeline, "RETRY_DELAY", -1)
+    payloads = season_payloads(league.season_weeks)
+    del payloads[12]   # 404
+    api.add_league("laliga", payloads)
+    process_league(league, forced_week=None, max_workers=4)
+    assert ScheduleIndex.load(league.meta_dir).built_at is not None
+
+    MetaStore.clear_cache()
+    api.reset_stats()
+    process_league(league, forced_week=None, max_workers=4)
+    # Solo la jornada que falló (calendario y plan), nunca la temporada entera
+    assert api.stats["status"] == {"404": 2}
@@ -0,0 +1,52 @@
+import json
+import time
+
+import pytest
+
+from conftest import season_payloads
+from scraper import pipeline
+from scraper.meta_store import MetaStore
+
+
+def _restart():
+    """Lo que ve un proceso nuevo: meta se vuelve a leer de disco."""
+    MetaStore.clear_cache()
+
+
+def test_unwritten_weeks_refetch_after_crash(api, league, monkeypatch):
+    weeks = list(range(1, league.season_weeks + 1))
+    api.add_league("laliga", season_payloads(league.season_weeks, goals=0))
+    pipeline.process_weeks(league, weeks, max_workers=4)
+    _restart()
+
+    # El servidor cambia todos los resultados y el proceso muere tras el primer lote escrito
+    fresh = season_payloads(league.season_weeks, goals=9)
+    api.add_league("laliga", fresh)
+    api.reset_stats()
+    write = pipeline.write_week_stage
+    written: list[int] = []
+
+    def write_then_crash(cfg, updates, schedule=None):
+        if written:
+            raise KeyboardInterrupt
+        deadline = time.monotonic() + 5
+        while api.stats["requests"] < len(weeks) and time.monotonic() < deadline:
+            time.sleep(0.01)   # todas las descargas hechas antes de escribir nada
+        write(cfg, updates[:1], schedule)
+        written.append(updates[0].week)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(pipeline, "write_week_stage", write_then_crash)
+    with pytest.raises(KeyboardInterrupt):
+        pipeline.process_weeks(league, weeks, max_workers=4)
+    assert api.stats["requests"] == len(weeks)
+    monkeypatch.setattr(pipeline, "write_week_stage", write)
+    _restart()
+
+    api.reset_stats()
+    updates = pipeline.process_weeks(league, weeks, max_workers=4)
+    assert api.stats["status"] == {"304": len(written), "200": len(weeks) - len(written)}
+    assert sorted(updates) == [w for w in weeks if w not in written]
+    for week in weeks:
+        saved = json.loads((league.out_dir_json / f"matches_week_{week}.json").read_text(encoding="utf-8"))
+        assert saved == league.adapter.canonical_payload(json.loads(fresh[week]))
@@ -0,0 +1,38 @@
+import json
+import shutil
+from datetime import datetime, timedelta, timezone
+
+from conftest import season_payloads
+from scraper.meta_store import CHECKS_FILE, MetaStore
+from scraper.pipeline import process_league
+from scraper.refresh import build_refresh_plan
+from scraper.schedule import ScheduleIndex
+
+
+def _fresh_checkout(league, tmp_path):
+    """Copia de data/ con lo que commitea el workflow: sin meta/checks.json."""
+    checkout = tmp_path / "checkout"
+    shutil.copytree(league.data_dir / league.slug, checkout / league.slug,
+                    ignore=shutil.ignore_patterns(CHECKS_FILE))
+    MetaStore.clear_cache()
+    return checkout
+
+
+def test_fresh_checkout_keeps_recheck_throttling(api, league, tmp_path):
+    # Temporada por jugar dentro de un mes: todas las jornadas son "lejanas"
+    payloads = {w: json.loads(b) for w, b in season_payloads(league.season_weeks).items()}
+    start = datetime.now(timezone.utc) + timedelta(days=30)
+    for week, body in payloads.items():
+        for m in body["matches"]:
+            m.update(status="PreMatch", home_score=None, away_score=None,
+                     date=(start + timedelta(days=7 * week)).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    api.add_league("laliga", {w: json.dumps(b).encode("utf-8") for w, b in payloads.items()})
+    process_league(league, forced_week=None, max_workers=4)
+
+    checkout = _fresh_checkout(league, tmp_path)
+    assert not (checkout / league.slug / "meta" / CHECKS_FILE).exists()
+    meta = MetaStore.load(checkout / league.slug / "meta")
+    schedule = ScheduleIndex.load(checkout / league.slug / "meta")
+    plan = build_refresh_plan(meta, schedule, range(1, league.season_weeks + 1), datetime.now(timezone.utc))
+    assert plan.fetch == []
+    assert set(plan.reasons.values()) == {"lejana (ya comprobada)"}
@@ -0,0 +1,40 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from conftest import season_payloads
+from scraper.watch import LeagueWatcher
+
+
+def _future_season(weeks: int, start: datetime) -> dict[int, dict]:
+    payloads = {w: json.loads(b) for w, b in season_payloads(weeks).items()}
+    for week, body in payloads.items():
+        for m in body["matches"]:
+            m.update(status="PreMatch", home_score=None, away_score=None,
+                     date=(start + timedelta(days=7 * week)).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    return payloads
+
+
+def _serve(api, payloads: dict[int, dict]):
+    api.add_league("laliga", {w: json.dumps(b).encode("utf-8") for w, b in payloads.items()})
+
+
+def test_replan_picks_up_a_moved_fixture(api, league):
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    payloads = _future_season(league.season_weeks, now + timedelta(days=1, hours=13))
+    _serve(api, payloads)
+    watcher = LeagueWatcher(league, max_workers=2)
+    watcher.start()
+    assert watcher.live_weeks(now) == []
+
+    # La jornada 1 se adelanta y ya ha empezado
+    payloads[1]["matches"][0]["date"] = (now - timedelta(minutes=10)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    _serve(api, payloads)
+    assert 1 in watcher.replan(now)
+    assert watcher.live_weeks(now) == [1]
+
+
+def test_midnight_placeholder_is_not_live(api, league):
+    watcher = LeagueWatcher(league)
+    midnight = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    watcher.pending = {3: [midnight], 4: [midnight + timedelta(minutes=30)]}
+    assert watcher.live_weeks(midnight + timedelta(hours=1)) == [4]